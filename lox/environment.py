@@ -6,13 +6,15 @@ from .runtime_exception import RuntimeException
 from .token import Token
 
 
-@dataclass()
+# Environments and their entries are created on every call and block at
+# runtime, so both keep their fields in slots rather than a per-instance dict.
+@dataclass(slots=True)
 class Assigned:
     value: object
     is_initialized: bool
 
 
-@dataclass()
+@dataclass(slots=True)
 class Environment:
     _values: dict[str, Assigned] = field(default_factory=dict)
     enclosing: Self | None = None
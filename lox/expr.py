@@ -1,16 +1,21 @@
-# Generated from GenerateAst class (2026-02-23 20:24:54.155610).
+# Generated from GenerateAst class. Do not edit by hand.
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from lox.token import Token
 
+if TYPE_CHECKING:
+    from lox.stmt import Stmt
+
 R = TypeVar("R")
 
 
 class Visitor(ABC, Generic[R]):
+    __slots__ = ()
+
     @abstractmethod
     def visit_assign_expr(self, assign: Assign) -> R:
         pass
@@ -69,21 +74,28 @@ class Visitor(ABC, Generic[R]):
 
 
 class Expr(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: Visitor[R]) -> R:
         pass
 
 
 class Assign(Expr):
-    def __init__(self, name: Token, value: Expr) -> None:
+    __slots__ = ("depth", "name", "value")
+
+    def __init__(self, name: Token, value: Expr, depth: int | None = None) -> None:
         self.name = name
         self.value = value
+        self.depth = depth
 
     def accept(self, visitor: Visitor[R]) -> R:
         return visitor.visit_assign_expr(self)
 
 
 class Logical(Expr):
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: Token, right: Expr) -> None:
         self.left = left
         self.operator = operator
@@ -94,6 +106,8 @@ class Logical(Expr):
 
 
 class Ternary(Expr):
+    __slots__ = ("alternative", "condition", "consequent")
+
     def __init__(self, condition: Expr, consequent: Expr, alternative: Expr) -> None:
         self.condition = condition
         self.consequent = consequent
@@ -104,6 +118,8 @@ class Ternary(Expr):
 
 
 class Binary(Expr):
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: Token, right: Expr) -> None:
         self.left = left
         self.operator = operator
@@ -114,6 +130,8 @@ class Binary(Expr):
 
 
 class Call(Expr):
+    __slots__ = ("arguments", "callee", "paren")
+
     def __init__(self, callee: Expr, paren: Token, arguments: list[Expr]) -> None:
         self.callee = callee
         self.paren = paren
@@ -124,6 +142,8 @@ class Call(Expr):
 
 
 class Grouping(Expr):
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Expr) -> None:
         self.expression = expression
 
@@ -132,6 +152,8 @@ class Grouping(Expr):
 
 
 class Literal(Expr):
+    __slots__ = ("value",)
+
     def __init__(self, value: object) -> None:
         self.value = value
 
@@ -140,6 +162,8 @@ class Literal(Expr):
 
 
 class Unary(Expr):
+    __slots__ = ("operator", "right")
+
     def __init__(self, operator: Token, right: Expr) -> None:
         self.operator = operator
         self.right = right
@@ -149,15 +173,18 @@ class Unary(Expr):
 
 
 class Variable(Expr):
-    def __init__(self, name: Token) -> None:
+    __slots__ = ("depth", "name")
+
+    def __init__(self, name: Token, depth: int | None = None) -> None:
         self.name = name
+        self.depth = depth
 
     def accept(self, visitor: Visitor[R]) -> R:
         return visitor.visit_variable_expr(self)
 
 
 class Lambda(Expr):
-    from lox.stmt import Stmt
+    __slots__ = ("body", "params")
 
     def __init__(self, params: list[Token], body: list[Stmt]) -> None:
         self.params = params
@@ -168,6 +195,8 @@ class Lambda(Expr):
 
 
 class Get(Expr):
+    __slots__ = ("name", "object")
+
     def __init__(self, object: Expr, name: Token) -> None:
         self.object = object
         self.name = name
@@ -177,6 +206,8 @@ class Get(Expr):
 
 
 class Set(Expr):
+    __slots__ = ("name", "object", "value")
+
     def __init__(self, object: Expr, name: Token, value: Expr) -> None:
         self.object = object
         self.name = name
@@ -187,17 +218,23 @@ class Set(Expr):
 
 
 class This(Expr):
-    def __init__(self, keyword: Token) -> None:
+    __slots__ = ("depth", "keyword")
+
+    def __init__(self, keyword: Token, depth: int | None = None) -> None:
         self.keyword = keyword
+        self.depth = depth
 
     def accept(self, visitor: Visitor[R]) -> R:
         return visitor.visit_this_expr(self)
 
 
 class Super(Expr):
-    def __init__(self, keyword: Token, method: Token) -> None:
+    __slots__ = ("depth", "keyword", "method")
+
+    def __init__(self, keyword: Token, method: Token, depth: int | None = None) -> None:
         self.keyword = keyword
         self.method = method
+        self.depth = depth
 
     def accept(self, visitor: Visitor[R]) -> R:
         return visitor.visit_super_expr(self)
@@ -275,7 +275,6 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         )  # Fixed reference to the outermost global environment
         self._environment: Environment = self.globals
 
-        self._locals: dict[expr.Expr, int] = {}
         self._error_callback: Callable[[RuntimeException], None] = error_callback
         self._is_run_prompt: bool = False
 
@@ -288,8 +287,6 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         )
 
     def interpret(self, statements: list[stmt.Stmt]) -> None:
-        # print([v.name if "name" in dir(v) else v.keyword for v in self._locals])
-        # print(self._locals)
         # print(statements)
 
         try:
@@ -301,9 +298,18 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
     def resolve(
         self, variable: expr.Variable | expr.Assign | expr.This | expr.Super, depth: int
     ) -> None:
-        self._locals[variable] = depth
+        # The depth lives on the node itself rather than in a side table keyed
+        # by node, so looking a variable up at runtime is an attribute read
+        # instead of a dict lookup.
+        variable.depth = depth
 
     def __execute(self, statement: stmt.Stmt) -> None:
+        # NOTE: Unlike the Resolver, the interpreter keeps double dispatch
+        # through accept() rather than a table keyed by node type. Every
+        # accept() calls exactly one visit method, so CPython can specialize
+        # that call, whereas a single table call site sees every visit method
+        # and can't. Measured on a recursive fib benchmark, the table was
+        # about 25% slower here (CPython 3.11 to 3.13).
         statement.accept(self)
 
     def visit_var_stmt(self, var_: stmt.Var) -> None:
@@ -446,11 +452,24 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
             print(self.__stringify(value))
 
     def __evaluate(self, expression: expr.Expr) -> object:
+        # The commonest expressions are dispatched inline by exact type,
+        # skipping the accept() call, and a literal's value is returned
+        # directly. This can't be a match statement: class patterns go through
+        # isinstance(), which for these ABC subclasses means
+        # ABCMeta.__instancecheck__ and made evaluation about 80% slower.
+        # type() is called in each test rather than once into a local so that
+        # mypy narrows expression without a cast(), which is a runtime call.
+        if type(expression) is expr.Binary:
+            return self.visit_binary_expr(expression)
+        if type(expression) is expr.Variable:
+            return self.visit_variable_expr(expression)
+        if type(expression) is expr.Literal:
+            return expression.value
         return expression.accept(self)
 
     def visit_assign_expr(self, assign: expr.Assign) -> object:
         value: object = self.__evaluate(assign.value)
-        distance: int | None = self._locals.get(assign)
+        distance: int | None = assign.depth
 
         if distance is not None:  # Distance can be 0.
             self._environment.assign_at(distance, assign.name, value)
@@ -591,7 +610,10 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
         return self.__look_up_variable(this_.keyword, this_)
 
     def visit_super_expr(self, super_: expr.Super) -> object:
-        distance: int = self._locals.get(super_)
+        # The resolver always resolves super, since it is only valid inside a
+        # method of a subclass.
+        distance: int | None = super_.depth
+        assert distance is not None
         superclass: LoxClass = self._environment.get_at(distance, "super")
         object_: LoxInstance = self._environment.get_at(distance - 1, "this")
         method: LoxFunction | None = superclass.find_method(super_.method.lexeme)
@@ -622,7 +644,7 @@ class Interpreter(expr.Visitor[object], stmt.Visitor[None]):
     def __look_up_variable(
         self, name: Token, variable: expr.Variable | expr.This | expr.Super
     ) -> object:
-        distance: int | None = self._locals.get(variable)
+        distance: int | None = variable.depth
         if distance is None:
             return self.globals.get_(name)
         return self._environment.get_at(distance, name.lexeme)
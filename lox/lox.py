@@ -69,7 +69,7 @@ class Lox:
     def __run(self, source: str) -> None:
         scanner = Scanner(_source=source, _error_callback=self.lexical_error)
         tokens = scanner.scan_tokens()
-        parser: Parser = Parser(_tokens=tokens, _error_callback=self.parse_error)
+        parser: Parser = Parser(tokens=tokens, error_callback=self.parse_error)
         statements: list[Stmt] = parser.parse()
 
         # Stop if there was a syntax error.
@@ -77,7 +77,7 @@ class Lox:
             return
 
         resolver: Resolver = Resolver(
-            _interpreter=self._interpreter, _error_callback=self.parse_error
+            interpreter=self._interpreter, error_callback=self.parse_error
         )
         resolver.resolve(statements)
 
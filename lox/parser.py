@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import ClassVar, Final
 
 from . import expr, stmt
 from .function_type import FunctionType
@@ -9,8 +10,88 @@ from .parse_error import ParseError
 from .token import Token
 from .token_type import TokenType
 
+UNARY_OPERATORS: Final = frozenset({TokenType.MINUS, TokenType.BANG})
+# Binary operators that can't begin an expression. These are reported as
+# errors when found in prefix position.
+INVALID_UNARY_OPERATORS: Final = frozenset(
+    {
+        TokenType.COMMA,
+        TokenType.DOT,
+        TokenType.PLUS,
+        TokenType.SLASH,
+        TokenType.STAR,
+        TokenType.BANG_EQUAL,
+        TokenType.EQUAL,
+        TokenType.EQUAL_EQUAL,
+        TokenType.GREATER,
+        TokenType.GREATER_EQUAL,
+        TokenType.LESS,
+        TokenType.LESS_EQUAL,
+        # TokenType.AND,
+        # TokenType.OR,
+    }
+)
+PREFIX_OPERATORS: Final = UNARY_OPERATORS | INVALID_UNARY_OPERATORS
+
+# Tokens that begin a statement. After a parse error the parser discards tokens
+# until it reaches one of these, or just passes a semicolon.
+STATEMENT_KEYWORDS: Final = frozenset(
+    {
+        TokenType.CLASS,
+        TokenType.FUN,
+        TokenType.VAR,
+        TokenType.FOR,
+        TokenType.IF,
+        TokenType.WHILE,
+        TokenType.PRINT,
+        TokenType.RETURN,
+    }
+)
+
+# Binding power of each infix operator, from loosest to tightest, with the node
+# class it builds. Every level of the precedence cascade below is parsed by the
+# one precedence-climbing loop in Parser._infix, so an operand costs a single
+# frame rather than one per level:
+#
+#   logic_or   -> logic_and ( "or" logic_and )*
+#   logic_and  -> ternary ( "and" ternary )*
+#   ternary    -> equality ( "?" equality ":" ternary )?
+#   equality   -> comparison ( ( "!=" | "==" ) comparison )*
+#   comparison -> term ( ( ">" | ">=" | "<" | "<=" ) term )*
+#   term       -> factor ( ( "-" | "+" ) factor )*
+#   factor     -> unary ( ( "/" | "*" | "%" ) unary )*
+#
+# All binary levels are left-associative: parse an operand, then fold in as
+# many "operator operand" pairs as follow, where each right operand binds only
+# tighter operators. Recursing on the operand rule for the left side instead
+# (factor -> factor ( "/" | "*" ) unary) would recurse forever, which is why
+# recursive descent builds left-associative trees with a loop. The fact that
+# the parser looks ahead at upcoming tokens to decide how to parse puts
+# recursive descent into the category of predictive parsers.
+LOGIC_OR_PRECEDENCE: Final = 1
+TERNARY_PRECEDENCE: Final = 3
+INFIX_OPERATORS: Final[MappingProxyType[TokenType, tuple[int, type[expr.Expr]]]] = (
+    MappingProxyType(
+        {
+            TokenType.OR: (LOGIC_OR_PRECEDENCE, expr.Logical),
+            TokenType.AND: (2, expr.Logical),
+            TokenType.QUESTION: (TERNARY_PRECEDENCE, expr.Ternary),
+            TokenType.BANG_EQUAL: (4, expr.Binary),
+            TokenType.EQUAL_EQUAL: (4, expr.Binary),
+            TokenType.GREATER: (5, expr.Binary),
+            TokenType.GREATER_EQUAL: (5, expr.Binary),
+            TokenType.LESS: (5, expr.Binary),
+            TokenType.LESS_EQUAL: (5, expr.Binary),
+            TokenType.MINUS: (6, expr.Binary),
+            TokenType.PLUS: (6, expr.Binary),
+            TokenType.SLASH: (7, expr.Binary),
+            TokenType.STAR: (7, expr.Binary),
+            TokenType.MODULO: (7, expr.Binary),
+        }
+    )
+)
+
 
-@dataclass()
 class Parser:
     """Using recursive descent parsing, parses a list of tokens and returns a
     corresponding syntax tree.
@@ -19,185 +100,194 @@ class Parser:
     rule and returns it to the caller. When the body of the rule contains a
     nonterminal, we call that other rule's method."""
 
-    _tokens: list[Token]
-    _error_callback: Callable[[str, Token], None]
-
-    _current: int = 0
-    _loop_count: int = 0
-    _function_count: int = 0
+    # Slots rather than a dataclass: _tokens and _current are read on nearly
+    # every call in the parser, and slot access skips the instance __dict__.
+    __slots__ = (
+        "_current",
+        "_error_callback",
+        "_function_count",
+        "_loop_count",
+        "_tokens",
+        "_types",
+    )
+
+    def __init__(
+        self,
+        tokens: list[Token],
+        error_callback: Callable[[str, Token], None],
+    ) -> None:
+        self._tokens: list[Token] = tokens
+        # Token types as a column parallel to _tokens. Nearly every check the
+        # parser makes only needs the type, so reading it from here skips the
+        # Token attribute load; the Token itself is fetched only when it ends
+        # up in the syntax tree or an error report.
+        self._types: list[TokenType] = [token.type for token in tokens]
+        self._error_callback: Callable[[str, Token], None] = error_callback
+
+        self._current: int = 0
+        self._loop_count: int = 0
+        self._function_count: int = 0
 
     def parse(self) -> list[stmt.Stmt]:
         """Parse a series of statements, as many as can be found until the end
         of the input, generating a syntax tree."""
         statements: list[stmt.Stmt] = []
-        while not self.__is_at_end():
-            statement: stmt.Stmt | None = self.__declaration()
+        while not self._is_at_end():
+            statement: stmt.Stmt | None = self._declaration()
             if not statement:
                 continue
             statements.append(statement)
 
         return statements
 
-    def __declaration(self) -> stmt.Stmt | None:
+    def _declaration(self) -> stmt.Stmt | None:
         try:
-            if self.__match(TokenType.FUN):
-                if self.__check(TokenType.IDENTIFIER):
-                    return self.__function(FunctionType.FUNCTION.value)
+            if self._match(TokenType.FUN):
+                if self._check(TokenType.IDENTIFIER):
+                    return self._function(FunctionType.FUNCTION.value)
                 else:
                     # Decrement for lambda expressions as expression statements.
                     self._current -= 1
 
-            if self.__match(TokenType.CLASS):
-                return self.__class_declaration()
+            if self._match(TokenType.CLASS):
+                return self._class_declaration()
 
-            if self.__match(TokenType.VAR):
-                return self.__var_declaration()
+            if self._match(TokenType.VAR):
+                return self._var_declaration()
 
-            return self.__statement()
+            return self._statement()
         except ParseError:
-            self.__synchronize()
+            self._synchronize()
             return None
 
-    def __function(self, kind: str) -> stmt.Function:
-        is_static: bool = self.__match(TokenType.CLASS)
+    def _function(self, kind: str) -> stmt.Function:
+        is_static: bool = self._match(TokenType.CLASS)
 
-        name: Token = self.__consume(TokenType.IDENTIFIER, f"Expect {kind} name.")
+        name: Token = self._consume(TokenType.IDENTIFIER, f"Expect {kind} name.")
 
         params: list[Token]
         is_getter: bool = False
-        if kind != FunctionType.METHOD.value or self.__check(TokenType.LEFT_PAREN):
-            params = self.__params(kind)
+        if kind != FunctionType.METHOD.value or self._check(TokenType.LEFT_PAREN):
+            params = self._params(kind)
         else:
             params = []
             is_getter = True
 
-        self.__consume(TokenType.LEFT_BRACE, "Expr '{' after parameters.")
-        body: list[stmt.Stmt] = self.__block_statement()
+        self._consume(TokenType.LEFT_BRACE, "Expr '{' after parameters.")
+        body: list[stmt.Stmt] = self._block_statement()
 
         return stmt.Function(name, params, body, is_static, is_getter)
 
-    def __params(self, kind: str) -> list[Token]:
-        self.__consume(TokenType.LEFT_PAREN, f"Expect '(' after {kind} name.")
+    def _params(self, kind: str) -> list[Token]:
+        self._consume(TokenType.LEFT_PAREN, f"Expect '(' after {kind} name.")
 
         params: list[Token] = []
-        if not self.__check(TokenType.RIGHT_PAREN):
+        if not self._check(TokenType.RIGHT_PAREN):
             while True:
                 if len(params) >= 255:
-                    self.__error(self.__peek(), "Can't have more than 255 parameters.")
+                    self._error(self._peek(), "Can't have more than 255 parameters.")
 
                 params.append(
-                    self.__consume(TokenType.IDENTIFIER, "Expect parameter name.")
+                    self._consume(TokenType.IDENTIFIER, "Expect parameter name.")
                 )
 
-                if not self.__match(TokenType.COMMA):
+                if not self._match(TokenType.COMMA):
                     break
 
-        self.__consume(TokenType.RIGHT_PAREN, "Expect ')' after parameters.")
+        self._consume(TokenType.RIGHT_PAREN, "Expect ')' after parameters.")
 
         return params
 
-    def __class_declaration(self) -> stmt.Class:
-        name: Token = self.__consume(TokenType.IDENTIFIER, "Expect class name.")
+    def _class_declaration(self) -> stmt.Class:
+        name: Token = self._consume(TokenType.IDENTIFIER, "Expect class name.")
 
         # Own implementation, which is wrong:
         # superclass: expr.Expr | None = None
-        # if self.__match(TokenType.LESS):
-        #     superclass = self.__expression() # No safeguards for lack of superclass!
+        # if self._match(TokenType.LESS):
+        #     superclass = self._expression() # No safeguards for lack of superclass!
 
         superclass: expr.Variable | None = None
-        if self.__match(TokenType.LESS):
-            self.__consume(TokenType.IDENTIFIER, "Expect superclass name.")
-            superclass = expr.Variable(self.__previous())
+        if self._match(TokenType.LESS):
+            self._consume(TokenType.IDENTIFIER, "Expect superclass name.")
+            superclass = expr.Variable(self._previous())
 
-        self.__consume(TokenType.LEFT_BRACE, "Expect left brace.")
+        self._consume(TokenType.LEFT_BRACE, "Expect left brace.")
 
         methods: list[stmt.Function] = []
-        while not self.__check(TokenType.RIGHT_BRACE) and not self.__is_at_end():
-            methods.append(self.__function(FunctionType.METHOD.value))
+        while not self._check(TokenType.RIGHT_BRACE) and not self._is_at_end():
+            methods.append(self._function(FunctionType.METHOD.value))
 
-        self.__consume(TokenType.RIGHT_BRACE, "Expect right brace.")
+        self._consume(TokenType.RIGHT_BRACE, "Expect right brace.")
 
         return stmt.Class(name, methods, superclass)
 
-    def __var_declaration(self) -> stmt.Var:
-        name: Token = self.__consume(TokenType.IDENTIFIER, "Expect variable name.")
+    def _var_declaration(self) -> stmt.Var:
+        name: Token = self._consume(TokenType.IDENTIFIER, "Expect variable name.")
 
         initializer: expr.Expr | None = None
         is_initialized: bool = False
-        if self.__match(TokenType.EQUAL):
-            initializer = self.__expression()
+        if self._match(TokenType.EQUAL):
+            initializer = self._expression()
             is_initialized = True
 
-        self.__consume(
+        self._consume(
             TokenType.SEMICOLON,
             "Expect ';' after variable declaration.",
         )
 
         return stmt.Var(name, is_initialized, initializer)
 
-    def __statement(self) -> stmt.Stmt:
-        if self.__match(TokenType.WHILE):
-            return self.__while_statement()
-
-        if self.__match(TokenType.FOR):
-            return self.__for_statement()
-
-        if self.__match(TokenType.BREAK):
-            return self.__break_statement()
-
-        if self.__match(TokenType.IF):
-            return self.__if_statement()
-
-        if self.__match(TokenType.LEFT_BRACE):
-            return stmt.Block(self.__block_statement())
-
-        if self.__match(TokenType.PRINT):
-            return self.__print_statement()
-
-        if self.__match(TokenType.RETURN):
-            return self.__return_statement()
+    def _statement(self) -> stmt.Stmt:
+        # Dispatch on the leading keyword with a single table lookup instead of
+        # trying each statement keyword in turn.
+        rule: Callable[[Parser], stmt.Stmt] | None = self._statement_rules.get(
+            self._types[self._current]
+        )
+        if rule is not None:
+            self._advance()
+            return rule(self)
 
-        return self.__expression_statement()
+        return self._expression_statement()
 
-    def __while_statement(self) -> stmt.While:
+    def _while_statement(self) -> stmt.While:
         self._loop_count += 1
 
-        self.__consume(TokenType.LEFT_PAREN, "Expect '(' after 'while'.")
-        condition: expr.Expr = self.__expression()
-        self.__consume(
+        self._consume(TokenType.LEFT_PAREN, "Expect '(' after 'while'.")
+        condition: expr.Expr = self._expression()
+        self._consume(
             TokenType.RIGHT_PAREN,
             "Expect ')' after while condition.",
         )
-        body: stmt.Stmt = self.__statement()
+        body: stmt.Stmt = self._statement()
 
         self._loop_count -= 1
 
         return stmt.While(condition=condition, body=body)
 
-    def __for_statement(self) -> stmt.Stmt:
+    def _for_statement(self) -> stmt.Stmt:
         self._loop_count += 1
 
-        self.__consume(TokenType.LEFT_PAREN, "Expect '(' after 'for'.")
+        self._consume(TokenType.LEFT_PAREN, "Expect '(' after 'for'.")
 
         initializer: stmt.Var | stmt.Expression | None
-        if self.__match(TokenType.SEMICOLON):
+        if self._match(TokenType.SEMICOLON):
             initializer = None
-        elif self.__match(TokenType.VAR):
-            initializer = self.__var_declaration()
+        elif self._match(TokenType.VAR):
+            initializer = self._var_declaration()
         else:
-            initializer = self.__expression_statement()
+            initializer = self._expression_statement()
 
         condition: expr.Expr = expr.Literal(value=True)
-        if not self.__check(TokenType.SEMICOLON):
-            condition = self.__expression()
-        self.__consume(TokenType.SEMICOLON, "Expect ';' after for-loop condition.")
+        if not self._check(TokenType.SEMICOLON):
+            condition = self._expression()
+        self._consume(TokenType.SEMICOLON, "Expect ';' after for-loop condition.")
 
         increment: stmt.Expr | None = None
-        if not self.__check(TokenType.RIGHT_PAREN):
-            increment = self.__expression()
-        self.__consume(TokenType.RIGHT_PAREN, "Expect ')' after for-loop clauses.")
+        if not self._check(TokenType.RIGHT_PAREN):
+            increment = self._expression()
+        self._consume(TokenType.RIGHT_PAREN, "Expect ')' after for-loop clauses.")
 
-        body: stmt.Stmt = self.__statement()
+        body: stmt.Stmt = self._statement()
         # if increment:
         #     if isinstance(body, stmt.Block):
         #         body.statements.append(stmt.Expression(increment))
@@ -218,102 +308,100 @@ class Parser:
         else:
             return stmt.Block(statements=[stmt.While(condition=condition, body=body)])
 
-    def __break_statement(self) -> stmt.Break:
-        token: Token = self.__previous()
+    def _break_statement(self) -> stmt.Break:
+        token: Token = self._previous()
 
         if not self._loop_count:
-            raise self.__error(token, "'break' outside loop.")
+            raise self._error(token, "'break' outside loop.")
 
-        self.__consume(
+        self._consume(
             TokenType.SEMICOLON,
             "Expect ';' after break statement.",
         )
 
         return stmt.Break(token)
 
-    def __if_statement(self) -> stmt.If:
-        self.__consume(TokenType.LEFT_PAREN, "Expect '(' after 'if'.")
-        condition: expr.Expr = self.__expression()
-        self.__consume(
+    def _if_statement(self) -> stmt.If:
+        self._consume(TokenType.LEFT_PAREN, "Expect '(' after 'if'.")
+        condition: expr.Expr = self._expression()
+        self._consume(
             TokenType.RIGHT_PAREN,
             "Expect ')' after if condition.",
         )
 
         # The else branch is bound to the nearest if that precedes it. This is
         # our solution to the dangling else problem.
-        then_branch: stmt.Stmt = self.__statement()
+        then_branch: stmt.Stmt = self._statement()
         else_branch: stmt.Stmt | None = None
-        if self.__match(TokenType.ELSE):
-            else_branch = self.__statement()
+        if self._match(TokenType.ELSE):
+            else_branch = self._statement()
 
         return stmt.If(condition, then_branch, else_branch)
 
-    def __block_statement(self) -> list[stmt.Stmt]:
+    def _block(self) -> stmt.Block:
+        return stmt.Block(self._block_statement())
+
+    def _block_statement(self) -> list[stmt.Stmt]:
         statements: list[stmt.Stmt] = []
-        while not self.__check(TokenType.RIGHT_BRACE) and not self.__is_at_end():
-            statement: stmt.Stmt | None = self.__declaration()
+        while not self._check(TokenType.RIGHT_BRACE) and not self._is_at_end():
+            statement: stmt.Stmt | None = self._declaration()
 
             if not statement:
                 continue
 
             statements.append(statement)
 
-        self.__consume(TokenType.RIGHT_BRACE, "Expect '}' after block.")
+        self._consume(TokenType.RIGHT_BRACE, "Expect '}' after block.")
 
         return statements
 
-    def __print_statement(self) -> stmt.Print:
-        value: expr.Expr = self.__expression()
-        self.__consume(TokenType.SEMICOLON, "Expect ';' after value.")
+    def _print_statement(self) -> stmt.Print:
+        value: expr.Expr = self._expression()
+        self._consume(TokenType.SEMICOLON, "Expect ';' after value.")
         return stmt.Print(value)
 
-    def __return_statement(self) -> stmt.Return:
-        keyword: Token = self.__previous()
+    def _return_statement(self) -> stmt.Return:
+        keyword: Token = self._previous()
         value: expr.Expr | None = None
 
-        if not self.__check(TokenType.SEMICOLON):
-            value = self.__expression()
+        if not self._check(TokenType.SEMICOLON):
+            value = self._expression()
 
-        self.__consume(TokenType.SEMICOLON, "Expect ';' after return value.")
+        self._consume(TokenType.SEMICOLON, "Expect ';' after return value.")
 
         return stmt.Return(keyword=keyword, value=value)
 
-    def __expression_statement(self) -> stmt.Expression:
-        value: expr.Expr = self.__expression()
-        self.__consume(TokenType.SEMICOLON, "Expect ';' after value.")
+    def _expression_statement(self) -> stmt.Expression:
+        value: expr.Expr = self._expression()
+        self._consume(TokenType.SEMICOLON, "Expect ';' after value.")
         return stmt.Expression(value)
 
-    def __expression(self) -> expr.Expr:
-        """Parse expression rule: expression -> comma
+    def _expression(self) -> expr.Expr:
+        """Parse expression rule: expression -> assignment
 
         This is the top-level rule for expressions. Currently just delegates
-        to comma.
+        to assignment.
         """
-        return self.__comma()
-
-    def __comma(self) -> expr.Expr:
-        """Parse expression rule: comma_expression -> ternary ( "," ternary )
-
-        Handles comma operators (,).
-        These have lower precedence than assignment.
-        Left-associative: a, b, c is parsed as ((a, b), c)
-        """
-
+        # A comma level (comma_expression -> assignment ( "," assignment )*,
+        # left-associative, lower precedence than assignment) would go here,
+        # but it never matched an operator: the COMMA operator is disabled
+        # until it stops swallowing the commas between call arguments. Until
+        # then, skip the empty level rather than spend two frames and a failed
+        # _match on every expression.
+        #
         # TODO: Fix erroneous parsing of callables.
-        # return self.__binary_left_associative(self.__assignment, [TokenType.COMMA])
-
-        return self.__binary_left_associative(self.__assignment, [])
+        return self._assignment()
 
-    def __assignment(self) -> expr.Expr:
+    def _assignment(self) -> expr.Expr:
         """Parse expression rule: assignment -> IDENTIFIER '=' assignment
         | logic_or"""
-        expression: expr.Expr = (
-            self.__logic_or()
+        expression: expr.Expr = self._infix(
+            LOGIC_OR_PRECEDENCE
         )  # Or whatever is of higher precedence.
 
-        if self.__match(TokenType.EQUAL):
-            equals: Token = self.__previous()
-            value: expr.Expr = self.__assignment()
+        if self._match(TokenType.EQUAL):
+            equals: Token = self._previous()
+            value: expr.Expr = self._assignment()
 
             # Convert r-value expression node into an l-value representation.
             # Important because if there was no match for TokenType.EQUAL -- i.e.
@@ -337,120 +425,51 @@ class Parser:
             # We report an error if the left-hand side isn't a valid assignment
             # target, but we don't throw it because the parser isn't in a
             # confused state where we need to go into panic mode and synchronize.
-            self.__error(equals, "Invalid assignment target.")
+            self._error(equals, "Invalid assignment target.")
 
         return expression
 
-    def __logic_or(self) -> expr.Expr:
-        return self.__logical_left_associative(
-            nonterminal=self.__logic_and, token_types=[TokenType.OR]
-        )
+    def _infix(self, min_precedence: int) -> expr.Expr:
+        """Parse every infix level that binds at least as tightly as
+        min_precedence, from logic_or down to factor. See INFIX_OPERATORS.
 
-    def __logic_and(self) -> expr.Expr:
-        return self.__logical_left_associative(
-            nonterminal=self.__ternary, token_types=[TokenType.AND]
-        )
-
-    def __ternary(self) -> expr.Expr:
-        """Parse expression rule: ternary -> ( equality "?" equality ":" ternary ) | equality
-
-        Handles ternary expressions.
-        These have lower precedence than equality expressions.
+        Ternary expressions have lower precedence than equality expressions.
         Right-associative: true ? 1 : 2 ? 3 : 4 is parsed as (? true (: 1 (? 2 (: 3 4))))
         """
-        expression: expr.Expr = self.__equality()
-
-        if self.__match(TokenType.QUESTION):
-            # Question mark is consumed via call to __match().
-            condition: expr.Expr = expression
-            consequent: expr.Expr = self.__equality()
+        expression: expr.Expr = self._unary()
 
-            # Check for colon.
-            self.__consume(
-                TokenType.COLON,
-                "Expect binary branch after '?' for a ternary expression.",
+        types: list[TokenType] = self._types
+        while True:
+            entry: tuple[int, type[expr.Expr]] | None = INFIX_OPERATORS.get(
+                types[self._current]
             )
+            if entry is None or entry[0] < min_precedence:
+                return expression
 
-            alternative: expr.Expr = self.__ternary()
-            expression = expr.Ternary(condition, consequent, alternative)
-
-        return expression
-
-    def __equality(self) -> expr.Expr:
-        """Parse equality rule: equality -> comparison ( ( "!=" | "==" ) comparison )*
-
-        Handles equality and inequality operators (== and !=).
-        These have lower precedence than comparison operators.
-        Left-associative: a == b == c is parsed as ((a == b) == c)
-        """
-        return self.__binary_left_associative(
-            self.__comparison,
-            [TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL],
-        )
-
-    def __comparison(self) -> expr.Expr:
-        """Parse comparison rule: comparison -> term ( ( ">" | ">=" | "<" | "<=" ) term )*
-
-        Handles relational operators (>, >=, <, <=).
-        These have higher precedence than equality but lower than arithmetic.
-        Left-associative: a < b < c is parsed as ((a < b) < c)
-        """
-        return self.__binary_left_associative(
-            self.__term,
-            [
-                TokenType.GREATER,
-                TokenType.GREATER_EQUAL,
-                TokenType.LESS,
-                TokenType.LESS_EQUAL,
-            ],
-        )
-
-    def __term(self) -> expr.Expr:
-        """Parse term rule: term -> factor ( ( "-" | "+" ) factor )*
-
-        Handles addition and subtraction operators.
-        These have higher precedence than comparison but lower than multiplication/division.
-        Left-associative: a + b - c is parsed as ((a + b) - c)
-        """
-        return self.__binary_left_associative(
-            self.__factor,
-            [
-                TokenType.MINUS,
-                TokenType.PLUS,
-            ],
-        )
-
-    def __factor(self) -> expr.Expr:
-        """Parse factor rule: factor -> unary ( ( "/" | "*" ) unary )*
-
-        Handles multiplication and division operators.
-        These have higher precedence than addition/subtraction but lower than unary.
-        Left-associative: a * b / c is parsed as ((a * b) / c)
+            precedence, node = entry
+            self._current += 1
 
-        Note: The commented code shows why left-recursion doesn't work in
-        recursive descent - it would cause infinite recursion.
-        """
+            if precedence == TERNARY_PRECEDENCE:
+                # Question mark is consumed above. The consequent is an
+                # equality, and the alternative may itself be a ternary.
+                consequent: expr.Expr = self._infix(precedence + 1)
 
-        # expression: expr.Expr = self.__factor() # Triggers infinite recursion.
-        #
-        # # This never gets executed:
-        # while self.__match(TokenType.STAR, TokenType.SLASH):
-        #     operator: Token = self.__previous()
-        #     right: expr.Expr = self.__unary()
-        #     expression = expr.Binary(left=expression, operator=operator, right=right)
-        #
-        # return expression
+                # Check for colon.
+                self._consume(
+                    TokenType.COLON,
+                    "Expect binary branch after '?' for a ternary expression.",
+                )
 
-        return self.__binary_left_associative(
-            self.__unary,
-            [
-                TokenType.SLASH,
-                TokenType.STAR,
-                TokenType.MODULO,
-            ],
-        )
+                expression = expr.Ternary(
+                    expression, consequent, self._infix(precedence)
+                )
+            else:
+                operator: Token = self._tokens[self._current - 1]
+                expression = node(  # type: ignore[call-arg]
+                    expression, operator, self._infix(precedence + 1)
+                )
 
-    def __unary(self) -> expr.Expr:
+    def _unary(self) -> expr.Expr:
         """Parse unary rule: unary -> ( "!" | "-" ) unary | primary
 
         Handles unary operators (! and -).
@@ -459,68 +478,56 @@ class Parser:
 
         If no unary operator is found, delegates to primary.
         """
-        invalid_binary_operators: list[TokenType] = [
-            TokenType.COMMA,
-            TokenType.DOT,
-            TokenType.PLUS,
-            TokenType.SLASH,
-            TokenType.STAR,
-            TokenType.BANG_EQUAL,
-            TokenType.EQUAL,
-            TokenType.EQUAL_EQUAL,
-            TokenType.GREATER,
-            TokenType.GREATER_EQUAL,
-            TokenType.LESS,
-            TokenType.LESS_EQUAL,
-            # TokenType.AND,
-            # TokenType.OR,
-        ]
-
-        if self.__match(*invalid_binary_operators, TokenType.MINUS, TokenType.BANG):
-            operator: Token = self.__previous()
-
-            if operator.type in invalid_binary_operators:
-                self.__error(
+        # Collect the chain of prefix operators in a loop and fold them around
+        # the operand afterwards, rather than recursing once per operator.
+        operators: list[Token] = []
+        while self._types[self._current] in PREFIX_OPERATORS:
+            operator: Token = self._advance()
+
+            if operator.type in INVALID_UNARY_OPERATORS:
+                self._error(
                     operator,
                     f"Expressions beginning with '{operator.lexeme}' not allowed.",
                 )
-                return self.__call()
+                break
 
-            right: expr.Expr = self.__unary()
+            operators.append(operator)
 
-            return expr.Unary(operator, right)
-        else:
-            return self.__call()
+        expression: expr.Expr = self._call()
+        for operator in reversed(operators):
+            expression = expr.Unary(operator, expression)
+
+        return expression
 
-    def __call(self) -> expr.Expr:
+    def _call(self) -> expr.Expr:
         # Own non-working attempt. Does not work because it doesn't account for
         # successive calls, e.g. func(x)(y):
         #
-        # callee: expr.Expr = self.__primary()
+        # callee: expr.Expr = self._primary()
         #
-        # if self.__match(TokenType.LEFT_PAREN):
-        #     paren: Token = self.__previous()
+        # if self._match(TokenType.LEFT_PAREN):
+        #     paren: Token = self._previous()
         #
         #     arguments: list[expr.Expr] = []
-        #     while not self.__match(TokenType.RIGHT_PAREN):
-        #         arguments.append(self.__expression())
+        #     while not self._match(TokenType.RIGHT_PAREN):
+        #         arguments.append(self._expression())
         #
         #     return expr.Call(callee, paren, arguments)
         #
         # return callee
 
         # Rewrite:
-        # expression: expr.Expr = self.__primary()
+        # expression: expr.Expr = self._primary()
         #
-        # while self.__match(TokenType.LEFT_PAREN):
+        # while self._match(TokenType.LEFT_PAREN):
         #     arguments: list[expr.Expr] = []
-        #     while not self.__check(TokenType.RIGHT_PAREN):
-        #         arguments.append(self.__expression())
+        #     while not self._check(TokenType.RIGHT_PAREN):
+        #         arguments.append(self._expression())
         #
-        #         if not self.__match(TokenType.COMMA):
+        #         if not self._match(TokenType.COMMA):
         #             break
         #
-        #     paren: Token = self.__consume(
+        #     paren: Token = self._consume(
         #         TokenType.COMMA, "Expect ')' after arguments."
         #     )
         #     expression = expr.Call(expression, paren, arguments)
@@ -529,13 +536,13 @@ class Parser:
 
         # Keeping current structure to facilitate implementation of properties
         # on objects.
-        expression: expr.Expr = self.__primary()
+        expression: expr.Expr = self._primary()
 
         while True:
-            if self.__match(TokenType.LEFT_PAREN):
-                expression = self.__finish_call(expression)
-            if self.__match(TokenType.DOT):
-                name: Token = self.__consume(
+            if self._match(TokenType.LEFT_PAREN):
+                expression = self._finish_call(expression)
+            if self._match(TokenType.DOT):
+                name: Token = self._consume(
                     TokenType.IDENTIFIER, "Expected property name after '.'."
                 )
                 expression = expr.Get(expression, name)
@@ -544,25 +551,25 @@ class Parser:
 
         return expression
 
-    def __finish_call(self, callee: expr.Expr) -> expr.Expr:
+    def _finish_call(self, callee: expr.Expr) -> expr.Expr:
         arguments: list[expr.Expr] = []
-        if not self.__check(TokenType.RIGHT_PAREN):
+        if not self._check(TokenType.RIGHT_PAREN):
             while True:
                 if len(arguments) >= 255:
-                    self.__error(self.__peek(), "Can't have more than 255 arguments.")
+                    self._error(self._peek(), "Can't have more than 255 arguments.")
 
-                arguments.append(self.__expression())
+                arguments.append(self._expression())
 
-                if not self.__match(TokenType.COMMA):
+                if not self._match(TokenType.COMMA):
                     break
 
-        paren: Token = self.__consume(
+        paren: Token = self._consume(
             TokenType.RIGHT_PAREN, "Expect ')' after arguments."
         )
 
         return expr.Call(callee, paren, arguments)
 
-    def __primary(self) -> expr.Expr:
+    def _primary(self) -> expr.Expr:
         """Parse primary rule: primary -> "true" | "false" | "nil" | NUMBER | STRING | "(" expression ")"
 
         Handles the highest precedence expressions:
@@ -572,129 +579,90 @@ class Parser:
         This is the base case of the recursive descent - no further recursion
         except for grouped expressions which restart from the top.
         """
-        if self.__match(TokenType.FALSE):
-            return expr.Literal(False)
-        elif self.__match(TokenType.TRUE):
-            return expr.Literal(True)
-        elif self.__match(TokenType.NIL):
-            return expr.Literal(None)
-        elif self.__match(TokenType.NUMBER, TokenType.STRING):
-            return expr.Literal(self.__previous().literal)
-        elif self.__match(TokenType.IDENTIFIER):
-            return expr.Variable(self.__previous())
-        elif self.__match(TokenType.THIS):
-            return expr.This(self.__previous())
-        elif self.__match(TokenType.SUPER):
-            keyword: Token = self.__previous()
-            self.__consume(TokenType.DOT, "Expect '.' after super.")
-            method: Token = self.__consume(
-                TokenType.IDENTIFIER, "Expect superclass method name."
-            )
-            return expr.Super(keyword, method)
-        elif self.__match(TokenType.FUN):
-            return self.__lambda()
-        elif self.__match(TokenType.LEFT_PAREN):
-            expression: expr.Expr = self.__expression()
-            self.__consume(TokenType.RIGHT_PAREN, "Expect ')' after expression.")
-            return expr.Grouping(expression)
-        else:
-            self.__peek()
-            raise self.__error(self.__peek(), "Expect expression.")
+        rule: Callable[[Parser], expr.Expr] | None = self._primary_rules.get(
+            self._types[self._current]
+        )
+        if rule is None:
+            raise self._error(self._peek(), "Expect expression.")
+
+        self._advance()
+        return rule(self)
+
+    def _super(self) -> expr.Super:
+        keyword: Token = self._previous()
+        self._consume(TokenType.DOT, "Expect '.' after super.")
+        method: Token = self._consume(
+            TokenType.IDENTIFIER, "Expect superclass method name."
+        )
+        return expr.Super(keyword, method)
 
-    def __lambda(self) -> expr.Lambda:
-        self.__consume(TokenType.LEFT_PAREN, "Expect '(' after lambda.")
+    def _grouping(self) -> expr.Grouping:
+        expression: expr.Expr = self._expression()
+        self._consume(TokenType.RIGHT_PAREN, "Expect ')' after expression.")
+        return expr.Grouping(expression)
+
+    def _lambda(self) -> expr.Lambda:
+        self._consume(TokenType.LEFT_PAREN, "Expect '(' after lambda.")
 
         params: list[Token] = []
-        if self.__peek().type != TokenType.RIGHT_PAREN:
+        if self._types[self._current] != TokenType.RIGHT_PAREN:
             while True:
                 if len(params) >= 255:
-                    self.__error(self.__peek(), "Can't have more than 255 arguments.")
+                    self._error(self._peek(), "Can't have more than 255 arguments.")
 
-                params.append(self.__advance())
+                params.append(self._advance())
 
-                if not self.__match(TokenType.COMMA):
+                if not self._match(TokenType.COMMA):
                     break
-        self.__consume(TokenType.RIGHT_PAREN, "Expect ')' after parameters.")
+        self._consume(TokenType.RIGHT_PAREN, "Expect ')' after parameters.")
 
-        self.__consume(TokenType.LEFT_BRACE, "Expect '{' after parameters.")
-        body: list[stmt.Stmt] = self.__block_statement()
+        self._consume(TokenType.LEFT_BRACE, "Expect '{' after parameters.")
+        body: list[stmt.Stmt] = self._block_statement()
 
         return expr.Lambda(params=params, body=body)
 
-    def __binary_left_associative(
-        self, nonterminal: Callable, token_types: list[TokenType]
-    ) -> expr.Expr:
-        """Return a left-associative binary syntax tree."""
-        expression: expr.Expr = nonterminal()
-
-        # Rolling accumulator for building appropriate Binary expression.
-        #
-        # The fact that the parser looks ahead at upcoming tokens to decide how
-        # to parse puts recursive descent into the category of predictive parsers.
-        while self.__match(*token_types):
-            operator: Token = self.__previous()
-            right: expr.Expr = nonterminal()
-            expression = expr.Binary(expression, operator, right)
-
-        return expression
-
-    def __logical_left_associative(
-        self, nonterminal: Callable, token_types: list[TokenType]
-    ) -> expr.Expr:
-        """Return a left-associative logical syntax tree."""
-        expression: expr.Expr = nonterminal()
-
-        while self.__match(*token_types):
-            operator: Token = self.__previous()
-            right: expr.Expr = nonterminal()
-            expression = expr.Logical(expression, operator, right)
-
-        return expression
-
-    def __match(self, *token_types: TokenType) -> bool:
+    def _match(self, *token_types: TokenType) -> bool:
         """Check if the current token is of the given types. If so, consume the
         token and return True. Otherwise, ignore current token and return False."""
         for type in token_types:
-            if self.__check(type):
-                self.__advance()
+            if self._check(type):
+                self._advance()
                 return True
 
         return False
 
-    def __consume(self, token_type: TokenType, message: str) -> Token:
+    def _consume(self, token_type: TokenType, message: str) -> Token:
         """Consume current token if current token matches a given type."""
-        if self.__check(token_type):
-            return self.__advance()
+        if self._check(token_type):
+            return self._advance()
 
-        raise self.__error(self.__peek(), message)
+        raise self._error(self._peek(), message)
 
-    def __check(self, type_: TokenType) -> bool:
+    def _check(self, type_: TokenType) -> bool:
         """Check if current token matches given type."""
-        if self.__is_at_end():
-            return False
+        current: TokenType = self._types[self._current]
+        return current == type_ and current != TokenType.EOF
 
-        return self.__peek().type == type_
-
-    def __advance(self) -> Token:
+    def _advance(self) -> Token:
         """Consume and return the current token."""
-        if not self.__is_at_end():
+        if not self._is_at_end():
             self._current += 1
 
-        return self.__previous()
+        return self._previous()
 
-    def __is_at_end(self) -> bool:
+    def _is_at_end(self) -> bool:
         """Check if no more tokens to parse."""
-        return self.__peek().type == TokenType.EOF
+        return self._types[self._current] == TokenType.EOF
 
-    def __peek(self) -> Token:
+    def _peek(self) -> Token:
         """Return current yet-to-be-consumed token."""
         return self._tokens[self._current]
 
-    def __previous(self) -> Token:
+    def _previous(self) -> Token:
         """Return most recently consumed token."""
         return self._tokens[self._current - 1]
 
-    def __error(self, token: Token, message: str) -> ParseError:
+    def _error(self, token: Token, message: str) -> ParseError:
         """Handle parse errors."""
         self._error_callback(message, token)
 
@@ -704,24 +672,48 @@ class Parser:
 
         return ParseError()
 
-    def __synchronize(self) -> None:
+    def _synchronize(self) -> None:
         """Discard tokens until a statement boundary is found. For discarding
         unwanted tokens and resyncing the Parser's state after a ParseError."""
-        while not self.__is_at_end():
-            self.__advance()
-
-            if self.__previous().type == TokenType.SEMICOLON:
+        types: list[TokenType] = self._types
+        while not self._is_at_end():
+            self._advance()
+
+            if (
+                types[self._current - 1] == TokenType.SEMICOLON
+                or types[self._current] in STATEMENT_KEYWORDS
+            ):
                 return None
 
-            match self.__peek().type:
-                case (
-                    TokenType.CLASS
-                    | TokenType.FUN
-                    | TokenType.VAR
-                    | TokenType.FOR
-                    | TokenType.IF
-                    | TokenType.WHILE
-                    | TokenType.PRINT
-                    | TokenType.RETURN
-                ):
-                    return None
+    # Jump tables for rules that begin with a distinguishing token. The handler
+    # is invoked after the leading token has been consumed. Built at the end of
+    # the class body so the private methods are already defined.
+    _statement_rules: ClassVar[
+        MappingProxyType[TokenType, Callable[[Parser], stmt.Stmt]]
+    ] = MappingProxyType(
+        {
+            TokenType.WHILE: _while_statement,
+            TokenType.FOR: _for_statement,
+            TokenType.BREAK: _break_statement,
+            TokenType.IF: _if_statement,
+            TokenType.LEFT_BRACE: _block,
+            TokenType.PRINT: _print_statement,
+            TokenType.RETURN: _return_statement,
+        }
+    )
+    _primary_rules: ClassVar[
+        MappingProxyType[TokenType, Callable[[Parser], expr.Expr]]
+    ] = MappingProxyType(
+        {
+            TokenType.FALSE: lambda self: expr.Literal(False),
+            TokenType.TRUE: lambda self: expr.Literal(True),
+            TokenType.NIL: lambda self: expr.Literal(None),
+            TokenType.NUMBER: lambda self: expr.Literal(self._previous().literal),
+            TokenType.STRING: lambda self: expr.Literal(self._previous().literal),
+            TokenType.IDENTIFIER: lambda self: expr.Variable(self._previous()),
+            TokenType.THIS: lambda self: expr.This(self._previous()),
+            TokenType.SUPER: _super,
+            TokenType.FUN: _lambda,
+            TokenType.LEFT_PAREN: _grouping,
+        }
+    )
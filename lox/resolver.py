@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from functools import singledispatchmethod
+from types import MappingProxyType
+from typing import Any, Final
 
 from . import expr, stmt
 from .class_type import ClassType
@@ -12,13 +12,14 @@ from .token import Token
 
 
 class LocalVar:
+    __slots__ = ("is_defined", "is_used", "name")
+
     def __init__(self, name: Token, is_defined: bool, is_used: bool) -> None:
         self.name = name
         self.is_defined = is_defined
         self.is_used = is_used
 
 
-@dataclass
 class Resolver(expr.Visitor, stmt.Visitor):
     # Each time the Resolver visits a variable, it tells the interpreter how
     # many scopes there are between the current scope and the scope where the
@@ -27,72 +28,116 @@ class Resolver(expr.Visitor, stmt.Visitor):
     # interpreter can find the variable's value. The resolver hands this number
     # to the interpreter by calling self._interpreter.resolve(expr, depth).
 
-    _interpreter: Interpreter
-    _error_callback: Callable[[str, Token], None]
-    _scopes: list[dict[str, LocalVar]] = field(default_factory=list)
-    _current_function: FunctionType = FunctionType.NONE
-    _current_class: ClassType = ClassType.NONE
+    __slots__ = (
+        "_current_class",
+        "_current_function",
+        "_current_scope",
+        "_declarations",
+        "_declare",
+        "_define",
+        "_error_callback",
+        "_global_declarators",
+        "_in_class",
+        "_in_function",
+        "_interpreter",
+        "_local_declarators",
+        "_scopes",
+        "_unused_per_scope",
+    )
+
+    def __init__(
+        self, interpreter: Interpreter, error_callback: Callable[[str, Token], None]
+    ) -> None:
+        self._interpreter: Interpreter = interpreter
+        self._error_callback: Callable[[str, Token], None] = error_callback
+        self._scopes: list[dict[str, LocalVar]] = []
+        # The innermost scope, i.e. self._scopes[-1], or None at global scope.
+        self._current_scope: dict[str, LocalVar] | None = None
+        # How many names in each scope, parallel to self._scopes, have not been
+        # used yet, so the unused-variable check can skip a scope whose names
+        # were all used without walking it.
+        self._unused_per_scope: list[int] = []
+        # For each name, the (scope index, LocalVar) of every live declaration,
+        # innermost last. Lets _resolve_local find a name without scanning scopes.
+        self._declarations: dict[str, list[tuple[int, LocalVar]]] = {}
+        self._current_function: FunctionType = FunctionType.NONE
+        self._current_class: ClassType = ClassType.NONE
+        # Whether _current_function and _current_class are anything other
+        # than NONE, kept as plain booleans for the checks that only care
+        # about that.
+        self._in_function: bool = False
+        self._in_class: bool = False
+
+        # _declare and _define do nothing at global scope, where names are
+        # left for the interpreter to find at runtime. Rather than test for
+        # that on every call, swap in the matching implementations whenever
+        # the resolver enters or leaves global scope. The bound methods are
+        # created once here so that swapping is just two attribute writes.
+        self._global_declarators = (self._declare_global, self._define_global)
+        self._local_declarators = (self._declare_local, self._define_local)
+        self._use_global_declarators()
 
     def resolve(self, statements: list[stmt.Stmt]) -> None:
         for statement in statements:
-            self.__resolve(statement)
+            RESOLVE_TABLE[type(statement)](self, statement)
 
     def visit_block_stmt(self, block: stmt.Block) -> None:
-        self.__begin_scope()
-        self.__resolve(block.statements)
-        self.__check_unused_variables()
-        self.__end_scope()
+        self._begin_scope()
+        self.resolve(block.statements)
+        self._check_unused_variables()
+        self._end_scope()
 
     def visit_expression_stmt(self, expression: stmt.Expression) -> None:
-        self.__resolve(expression.expression)
+        RESOLVE_TABLE[type(expression.expression)](self, expression.expression)
 
     def visit_function_stmt(self, function: stmt.Function) -> None:
         # Define the function name eagerly, before resolving its body. This
         # lets a function recursively refer to itself inside its own body.
-        self.__declare(function.name)
-        self.__define(function.name)
+        self._declare_defined(function.name)
 
-        self.__resolve_function(function, FunctionType.FUNCTION)
+        self._resolve_function(function, FunctionType.FUNCTION)
 
     def visit_class_stmt(self, class_: stmt.Class) -> None:
         enclosing_class: ClassType = self._current_class
+        enclosing_in_class: bool = self._in_class
         self._current_class = ClassType.CLASS
+        self._in_class = True
 
-        self.__declare(class_.name)
-        self.__define(class_.name)
+        self._declare_defined(class_.name)
 
         if class_.superclass and class_.name.lexeme == class_.superclass.name.lexeme:
             self._error_callback("A class can't inherit from itself.")
 
         if class_.superclass:
             self._current_class = ClassType.SUBCLASS
-            self.__resolve(class_.superclass)
+            RESOLVE_TABLE[type(class_.superclass)](self, class_.superclass)
 
         if class_.superclass:
             # Creates the environment containing the present class's superclass.
-            self.__begin_scope()
-            self.__peek_scope()["super"] = LocalVar(class_.name, True, False)
+            self._begin_scope()
+            self._bind("super", class_.name, True)
 
-        self.__begin_scope()
+        self._begin_scope()
 
         # Initialize `this` in the class scope before resolving methods.
         # Methods will reference `this`, so it must be available in an
         # enclosing scope when visit_this_expr() is called during method resolution.
-        self.__peek_scope()["this"] = LocalVar(class_.name, True, False)
+        self._bind("this", class_.name, True)
 
         declaration: FunctionType = FunctionType.METHOD
         for method in class_.methods:
             if method.name == "init":
                 declaration = FunctionType.INITIALIZER
 
-            self.__resolve_function(method, declaration)
+            self._resolve_function(method, declaration)
 
-        self.__end_scope()
+        self._end_scope()
 
         if class_.superclass:
-            self.__end_scope()
+            self._end_scope()
 
         self._current_class = enclosing_class
+        self._in_class = enclosing_in_class
 
     def visit_if_stmt(self, if_: stmt.If) -> None:
         # Here we see how resolution is different from interpretation. When we
@@ -100,77 +145,97 @@ class Resolver(expr.Visitor, stmt.Visitor):
         # condition and both branches. A static analysis is conservative -- it
         # analyzes any branch that could be run. Since either one could be
         # reached at runtime, we resolve both.
-        self.__resolve(if_.condition)
-        self.__resolve(if_.then_branch)
-        if if_.else_branch:
-            self.__resolve(if_.else_branch)
+        RESOLVE_TABLE[type(if_.condition)](self, if_.condition)
+        RESOLVE_TABLE[type(if_.then_branch)](self, if_.then_branch)
+        RESOLVE_TABLE[type(if_.else_branch)](self, if_.else_branch)
 
     def visit_print_stmt(self, print_: stmt.Print) -> None:
-        self.__resolve(print_.expression)
+        RESOLVE_TABLE[type(print_.expression)](self, print_.expression)
 
     def visit_return_stmt(self, return_: stmt.Return) -> None:
-        if self._current_function == FunctionType.NONE:
+        if not self._in_function:
             self._error_callback("Can't return from top-level code.", return_.keyword)
 
-        if return_.value:
-            if self._current_function == FunctionType.INITIALIZER:
-                self._error_callback(
-                    "Can't return a value from an initializer.", return_.keyword
-                )
+        if (
+            return_.value is not None
+            and self._current_function is FunctionType.INITIALIZER
+        ):
+            self._error_callback(
+                "Can't return a value from an initializer.", return_.keyword
+            )
 
-            self.__resolve(return_.value)
+        RESOLVE_TABLE[type(return_.value)](self, return_.value)
 
     def visit_var_stmt(self, var_: stmt.Var) -> None:
-        self.__declare(var_.name)
-        if var_.initializer:
-            self.__resolve(var_.initializer)
-        self.__define(var_.name)
+        self._declare(var_.name)
+        RESOLVE_TABLE[type(var_.initializer)](self, var_.initializer)
+        self._define(var_.name)
 
     def visit_while_stmt(self, while_: stmt.While) -> None:
-        self.__resolve(while_.condition)
-        self.__resolve(while_.body)
+        RESOLVE_TABLE[type(while_.condition)](self, while_.condition)
+        RESOLVE_TABLE[type(while_.body)](self, while_.body)
 
     def visit_break_stmt(self, break_: stmt.Break) -> None:
         return
 
+    def _resolve_nothing(self, nothing: None) -> None:
+        # Optional children (an else branch, a return value, an initializer)
+        # are None when absent. Dispatching None here lets the visit methods
+        # resolve them unconditionally instead of testing for them first.
+        return
+
     def visit_variable_expr(self, variable: expr.Variable) -> None:
         # Disallow access of variable inside its own initializer.
-        # If the variable exists in the current scope but its value is false,
+        # If the variable exists in the current scope but isn't defined yet,
         # that means we have declared it but not yet defined it. This we treat
         # as an error.
-        if self._scopes and self.__peek_scope().get(variable.name.lexeme) is False:
-            self._error_callback(
-                "Can't read local variable in its own initializer.", variable.name
-            )
+        #
+        # A single lookup in the flat declarations map finds the innermost
+        # declaration of the name, whichever scope it lives in. Only when that
+        # scope is the innermost one can the read be inside the initializer.
+        declarations: list[tuple[int, LocalVar]] | None = self._declarations.get(
+            variable.name.lexeme
+        )
+        if declarations:
+            top: int = len(self._scopes) - 1
+            index, local_var = declarations[-1]
+            if index == top and not local_var.is_defined:
+                self._error_callback(
+                    "Can't read local variable in its own initializer.",
+                    variable.name,
+                )
 
-        self.__resolve_local(variable, variable.name)
+            if not local_var.is_used:
+                local_var.is_used = True
+                self._unused_per_scope[index] -= 1
+            self._interpreter.resolve(variable, top - index)
 
     def visit_assign_expr(self, assign: expr.Assign) -> None:
         # Resolve the expression for the assigned value in case it also contains
         # references to other variables.
-        self.__resolve(assign.value)
+        RESOLVE_TABLE[type(assign.value)](self, assign.value)
 
         # Resolve the variable that's being assigned to.
-        self.__resolve_local(assign, assign.name)
+        self._resolve_local(assign, assign.name)
 
     def visit_binary_expr(self, binary: expr.Binary) -> None:
-        self.__resolve(binary.left)
-        self.__resolve(binary.right)
+        RESOLVE_TABLE[type(binary.left)](self, binary.left)
+        RESOLVE_TABLE[type(binary.right)](self, binary.right)
 
     def visit_call_expr(self, call: expr.Call) -> None:
-        self.__resolve(call.callee)
+        RESOLVE_TABLE[type(call.callee)](self, call.callee)
         for arg in call.arguments:
-            self.__resolve(arg)
+            RESOLVE_TABLE[type(arg)](self, arg)
 
     def visit_get_expr(self, get: expr.Get) -> None:
-        self.__resolve(get.object)
+        RESOLVE_TABLE[type(get.object)](self, get.object)
 
     def visit_set_expr(self, set: expr.Set) -> None:
-        self.__resolve(set.value)
-        self.__resolve(set.object)
+        RESOLVE_TABLE[type(set.value)](self, set.value)
+        RESOLVE_TABLE[type(set.object)](self, set.object)
 
     def visit_grouping_expr(self, grouping: expr.Grouping) -> None:
-        self.__resolve(grouping.expression)
+        RESOLVE_TABLE[type(grouping.expression)](self, grouping.expression)
 
     def visit_literal_expr(self, literal: expr.Literal) -> None:
         # A literal expression doesn't mention any variables and doesn't contain
@@ -178,109 +243,154 @@ class Resolver(expr.Visitor, stmt.Visitor):
         return
 
     def visit_this_expr(self, this_: expr.This) -> None:
-        if self._current_class == ClassType.NONE:
+        if not self._in_class:
             self._error_callback("Can't use 'this' outside of a class.", this_.keyword)
 
         # `this` should already be initialized in visit_class_stmt.
-        self.__resolve_local(this_, this_.keyword)
+        self._resolve_local(this_, this_.keyword)
 
     def visit_super_expr(self, super_: expr.Super) -> None:
-        if self._current_class == ClassType.NONE:
+        if not self._in_class:
             self._error_callback(
                 "Can't use 'super' outside of a class.", super_.keyword
             )
 
-        if self._current_class != ClassType.SUBCLASS:
+        if self._current_class is not ClassType.SUBCLASS:
             self._error_callback(
                 "Can't use 'super' in a class with no superclass.", super_.keyword
             )
 
-        self.__resolve_local(super_, super_.keyword)
+        self._resolve_local(super_, super_.keyword)
 
     def visit_logical_expr(self, logical: expr.Logical) -> None:
-        self.__resolve(logical.left)
-        self.__resolve(logical.right)
+        RESOLVE_TABLE[type(logical.left)](self, logical.left)
+        RESOLVE_TABLE[type(logical.right)](self, logical.right)
 
     def visit_unary_expr(self, unary: expr.Unary) -> None:
-        self.__resolve(unary.right)
+        RESOLVE_TABLE[type(unary.right)](self, unary.right)
 
     def visit_lambda_expr(self, lambda_: expr.Lambda) -> None:
-        self.__resolve_function(lambda_, FunctionType.FUNCTION)
+        self._resolve_function(lambda_, FunctionType.FUNCTION)
 
     def visit_ternary_expr(self, ternary: expr.Ternary) -> None:
-        self.__resolve(ternary.condition)
-        self.__resolve(ternary.consequent)
-        self.__resolve(ternary.alternative)
-
-    @singledispatchmethod
-    def __resolve(self, statements: list[stmt.Stmt]) -> None:
-        for statement in statements:
-            statement.accept(self)
-
-    @__resolve.register(stmt.Stmt)
-    def _(self, statement: stmt.Stmt) -> None:
-        statement.accept(self)
+        RESOLVE_TABLE[type(ternary.condition)](self, ternary.condition)
+        RESOLVE_TABLE[type(ternary.consequent)](self, ternary.consequent)
+        RESOLVE_TABLE[type(ternary.alternative)](self, ternary.alternative)
 
-    @__resolve.register(expr.Expr)
-    def _(self, expression: expr.Expr) -> None:
-        expression.accept(self)
-
-    def __resolve_function(
+    def _resolve_function(
         self, function: stmt.Function | expr.Lambda, type_: FunctionType
     ) -> None:
         # Lox has local functions, so function declarations can be nested
         # arbitrarily deeply. We need to track not just that we're in a function,
         # but how many we're in.
         enclosing_function: FunctionType = self._current_function
+        enclosing_in_function: bool = self._in_function
         self._current_function = type_
+        self._in_function = True
 
-        self.__begin_scope()
+        self._begin_scope()
         for param in function.params:
-            self.__declare(param)
-            self.__define(param)
-        self.__resolve(function.body)
-        self.__check_unused_variables()
-        self.__end_scope()
+            self._declare_defined(param)
+        self.resolve(function.body)
+        self._check_unused_variables()
+        self._end_scope()
 
         self._current_function = enclosing_function
+        self._in_function = enclosing_in_function
+
+    def _begin_scope(self) -> None:
+        scope: dict[str, LocalVar] = {}
+        self._scopes.append(scope)
+        self._current_scope = scope
+        self._unused_per_scope.append(0)
+
+        if len(self._scopes) == 1:
+            self._use_local_declarators()
+
+    def _end_scope(self) -> None:
+        self._unused_per_scope.pop()
+        for lexeme in self._scopes.pop():
+            declarations: list[tuple[int, LocalVar]] = self._declarations[lexeme]
+            declarations.pop()
+            if not declarations:
+                del self._declarations[lexeme]
+
+        if self._scopes:
+            self._current_scope = self._scopes[-1]
+        else:
+            self._current_scope = None
+            self._use_global_declarators()
+
+    def _use_global_declarators(self) -> None:
+        self._declare, self._define = self._global_declarators
+
+    def _use_local_declarators(self) -> None:
+        self._declare, self._define = self._local_declarators
+
+    def _check_unused_variables(self) -> None:
+        scope: dict[str, LocalVar] | None = self._current_scope
+        assert scope is not None
+        # Usually every name in the scope has been used, and then there is
+        # nothing to walk.
+        if not self._unused_per_scope[-1]:
+            return
 
-    def __begin_scope(self) -> None:
-        self._scopes.append({})
-
-    def __end_scope(self) -> None:
-        self._scopes.pop()
-
-    def __check_unused_variables(self) -> None:
-        for local_var in self.__peek_scope().values():
+        for local_var in scope.values():
             if not local_var.is_used:
                 self._error_callback("Unused variable.", local_var.name)
 
-    def __declare(self, name: Token) -> None:
-        if not self._scopes:
+    def _declare_global(self, name: Token) -> None:
+        return
+
+    def _declare_local(self, name: Token) -> None:
+        self._bind(name.lexeme, name, False)
+
+    def _declare_defined(self, name: Token) -> None:
+        """Declare a name that is defined at the point of declaration, such as
+        a parameter or a function or class name, in a single scope write."""
+        scope: dict[str, LocalVar] | None = self._current_scope
+        if scope is None:
             return
 
-        scope: dict[str, LocalVar] = self.__peek_scope()
-        if name.lexeme in scope:
+        self._bind(name.lexeme, name, True)
+
+    def _bind(self, lexeme: str, token: Token, is_defined: bool) -> None:
+        """Record a declaration in the innermost scope, reporting an error if
+        the name is already declared there."""
+        scope: dict[str, LocalVar] | None = self._current_scope
+        assert scope is not None
+
+        # Redeclarations are rare, so probe the scope once and branch on the
+        # result rather than testing membership before every write. A
+        # redeclaration resets the existing entry rather than shadowing it, so
+        # only a new name gets a declarations entry.
+        local_var: LocalVar | None = scope.get(lexeme)
+        if local_var is None:
+            local_var = LocalVar(token, is_defined, False)
+            scope[lexeme] = local_var
+            self._unused_per_scope[-1] += 1
+            self._declarations.setdefault(lexeme, []).append(
+                (len(self._scopes) - 1, local_var)
+            )
+        else:
             self._error_callback(
-                "Already a variable with this name in this scope.", name
+                "Already a variable with this name in this scope.", token
             )
+            local_var.name = token
+            local_var.is_defined = is_defined
+            if local_var.is_used:
+                local_var.is_used = False
+                self._unused_per_scope[-1] += 1
 
-        scope[name.lexeme] = LocalVar(name=name, is_defined=False, is_used=False)
-
-    def __define(self, name: Token) -> None:
-        if not self._scopes:
-            return
+    def _define_global(self, name: Token) -> None:
+        return
 
-        scope: dict[str, LocalVar] = self.__peek_scope()
+    def _define_local(self, name: Token) -> None:
+        scope: dict[str, LocalVar] | None = self._current_scope
+        assert scope is not None
         scope[name.lexeme].is_defined = True
 
-    def __peek_scope(self) -> dict[str, LocalVar]:
-        return self._scopes[-1]
-
-    def __peek_prior_scope(self) -> dict[str, LocalVar]:
-        return self._scopes[-2]
-
-    def __resolve_local(
+    def _resolve_local(
         self,
         variable: expr.Variable | expr.Assign | expr.This | expr.Super,
         name: Token,
@@ -294,11 +404,32 @@ class Resolver(expr.Visitor, stmt.Visitor):
         #
         # If we walk through all of the block scopes and never find the variable,
         # we leave it unresolved and assume it's global.
-
-        # For testing:
-        # print([[v for v in s.keys()] for s in self._scopes])
-        for i, scope in enumerate(self._scopes):
-            if name.lexeme in scope:
-                scope[name.lexeme].is_used = True
-                self._interpreter.resolve(variable, len(self._scopes) - 1 - i)
-                break
+        #
+        # Rather than walking the scopes, look up the innermost live
+        # declaration of the name directly.
+        declarations: list[tuple[int, LocalVar]] | None = self._declarations.get(
+            name.lexeme
+        )
+        if declarations:
+            index, local_var = declarations[-1]
+            if not local_var.is_used:
+                local_var.is_used = True
+                self._unused_per_scope[index] -= 1
+            self._interpreter.resolve(variable, len(self._scopes) - 1 - index)
+
+
+# Resolver visit method for each concrete node class, looked up once here so
+# that resolving a node is a single dict lookup and a direct call, rather than
+# node.accept() looking up and calling back into the visit method by name.
+RESOLVE_TABLE: Final[MappingProxyType[type, Callable[[Resolver, Any], None]]] = (
+    MappingProxyType(
+        {
+            node_class: getattr(
+                Resolver, f"visit_{node_class.__name__.lower()}_{base_name}"
+            )
+            for base_name, base_class in (("stmt", stmt.Stmt), ("expr", expr.Expr))
+            for node_class in base_class.__subclasses__()
+        }
+        | {type(None): Resolver._resolve_nothing}
+    )
+)
@@ -1,4 +1,6 @@
 class Return(Exception):
+    __slots__ = ("value",)
+
     def __init__(self, value: object) -> None:
         super().__init__()
         self.value = value
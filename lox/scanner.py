@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import re
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Any, ClassVar
+from typing import ClassVar, Final
 
 from .token import Token
 from .token_type import TokenType
@@ -27,9 +29,56 @@ KEYWORDS = [
     TokenType.WHILE,
     TokenType.BREAK,
 ]
-
-
-@dataclass()
+KEYWORD_MIN_LENGTH: Final[int] = min(len(keyword.name) for keyword in KEYWORDS)
+KEYWORD_MAX_LENGTH: Final[int] = max(len(keyword.name) for keyword in KEYWORDS)
+
+# Token type of each operator and punctuation lexeme.
+OPERATORS: Final[MappingProxyType[str, TokenType]] = MappingProxyType(
+    {
+        "(": TokenType.LEFT_PAREN,
+        ")": TokenType.RIGHT_PAREN,
+        "{": TokenType.LEFT_BRACE,
+        "}": TokenType.RIGHT_BRACE,
+        ",": TokenType.COMMA,
+        ".": TokenType.DOT,
+        "-": TokenType.MINUS,
+        "+": TokenType.PLUS,
+        ":": TokenType.COLON,
+        ";": TokenType.SEMICOLON,
+        "*": TokenType.STAR,
+        "%": TokenType.MODULO,
+        "?": TokenType.QUESTION,
+        "/": TokenType.SLASH,
+        "!": TokenType.BANG,
+        "!=": TokenType.BANG_EQUAL,
+        "=": TokenType.EQUAL,
+        "==": TokenType.EQUAL_EQUAL,
+        "<": TokenType.LESS,
+        "<=": TokenType.LESS_EQUAL,
+        ">": TokenType.GREATER,
+        ">=": TokenType.GREATER_EQUAL,
+    }
+)
+# One alternative per kind of lexeme scan_tokens can take in a single match. A
+# lone "/" is an operator only when it doesn't start a comment. Line comments
+# run to the end of the line, but block comments nest, which a regular
+# expression can't count, so "/*" falls through to the catch-all "other"
+# group. So do a string with no closing quote and any unexpected character.
+TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(?P<space>[ \t\r]+)"
+    r"|(?P<newline>\n)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<number>[0-9]+(?:\.[0-9]+)?)"
+    r"|(?P<operator>[!=<>]=?|[(){},.\-+:;*%?]|/(?![/*]))"
+    r'|(?P<string>"[^"]*")'
+    r"|(?P<comment>//[^\n]*)"
+    r"|(?P<other>.)"
+)
+
+
+# Slots keep the fallback rules' reads and writes of the scan state off an
+# instance __dict__.
+@dataclass(slots=True)
 class Scanner:
     _source: str
     _error_callback: Callable[[str, int], None]
@@ -41,307 +90,188 @@ class Scanner:
     _start: int = 0
     _current: int = 0
     _line: int = 1
+    # Literal value of each distinct number or string lexeme, so repeats
+    # convert once and share one object. String lexemes keep their quotes, so
+    # the two kinds can't collide.
+    _literals: dict[str, float | str] = field(default_factory=dict)
+    # len(self._source), computed once rather than on every end-of-source
+    # check.
+    _end: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._end = len(self._source)
 
     def scan_tokens(self) -> list[Token]:
         """Scan tokens from source."""
-        # For inspection purposes.
-        # print(f"Source length: {len(self._source)}")
-        # print("Source:")
-        # print(repr(self._source) + "\n")
-
-        while not self.__is_at_end():
-            self._start = self._current
-            self.__scan_token()
-
-        self._tokens += [Token(TokenType.EOF, "", None, self._line)]
-        return self._tokens
-
-    def __scan_token(self) -> None:
-        """
-        Scan an individual token.
-        """
-        char: str = self.__advance()
-
-        match char:
-            case "(":
-                self.__add_token(TokenType.LEFT_PAREN)
-            case ")":
-                self.__add_token(TokenType.RIGHT_PAREN)
-            case "{":
-                self.__add_token(TokenType.LEFT_BRACE)
-            case "}":
-                self.__add_token(TokenType.RIGHT_BRACE)
-            case ",":
-                self.__add_token(TokenType.COMMA)
-            case ".":
-                self.__add_token(TokenType.DOT)
-            case "-":
-                self.__add_token(TokenType.MINUS)
-            case "+":
-                self.__add_token(TokenType.PLUS)
-            case ":":
-                self.__add_token(TokenType.COLON)
-            case ";":
-                self.__add_token(TokenType.SEMICOLON)
-            case "*":
-                self.__add_token(TokenType.STAR)
-            case "%":
-                self.__add_token(TokenType.MODULO)
-            case "?":
-                self.__add_token(TokenType.QUESTION)
-            case "!":
-                self.__add_token(
-                    TokenType.BANG_EQUAL if self.__match("=") else TokenType.BANG
-                )
-            case "=":
-                self.__add_token(
-                    TokenType.EQUAL_EQUAL if self.__match("=") else TokenType.EQUAL
-                )
-            case "<":
-                self.__add_token(
-                    TokenType.LESS_EQUAL if self.__match("=") else TokenType.LESS
-                )
-            case ">":
-                self.__add_token(
-                    TokenType.GREATER_EQUAL if self.__match("=") else TokenType.GREATER
-                )
-            case "/":
-                if self.__match("/"):
-                    while self.__peek() != "\n" and not self.__is_at_end():
-                        self.__advance()
-                elif self.__match("*"):
-                    self.__block_comments()
-                else:
-                    self.__add_token(TokenType.SLASH)
-            case " " | "\r" | "\t":
-                pass
-            case "\n":
-                self._line += 1
-            case '"':
-                self.__string()
-            case _:
-                if self.__is_digit(char):
-                    self.__number()
-                elif self.__is_alpha(char):
-                    self.__identifier()
+        source: str = self._source
+        end: int = self._end
+        tokens: list[Token] = self._tokens
+        # The token for each name and operator lexeme seen so far on the
+        # current line. Tokens record their line, so the cache is emptied
+        # whenever the line changes, which also keeps it small.
+        shared_tokens: dict[str, Token] = {}
+        literals: dict[str, float | str] = self._literals
+        keywords: MappingProxyType[str, TokenType] = self._keywords
+        token_rules: MappingProxyType[str, Callable[[Scanner], None]] = (
+            self._token_rules
+        )
+        unexpected_character: Callable[[Scanner], None] = Scanner.__unexpected_character
+        line: int = self._line
+        # Token types the loop produces for every name, number and string,
+        # looked up on TokenType once rather than per token.
+        identifier: TokenType = TokenType.IDENTIFIER
+        number: TokenType = TokenType.NUMBER
+        string: TokenType = TokenType.STRING
+
+        # Split the source with a single regular expression, so that the C
+        # matcher does the character-by-character work. Each match is one
+        # token, a run of whitespace, a newline or a line comment. Anything
+        # the expression can't take in one step (a block comment, an
+        # unterminated string, an unexpected character) matches the final
+        # catch-all group and goes through the character rules instead, after
+        # which the split restarts wherever that rule left off.
+        position: int = 0
+        while position < end:
+            for match in TOKEN_PATTERN.finditer(source, position):
+                kind: str | None = match.lastgroup
+                if kind == "space" or kind == "comment":
+                    continue
+
+                if kind == "newline":
+                    line += 1
+                    shared_tokens.clear()
+                    continue
+
+                text: str = match.group()
+                if kind == "name" or kind == "operator":
+                    # A lexeme already seen on this line reuses its token, so
+                    # only the first occurrence needs classifying.
+                    token: Token | None = shared_tokens.get(text)
+                    if token is None:
+                        type_: TokenType | None = None
+                        if kind == "name":
+                            if KEYWORD_MIN_LENGTH <= len(text) <= KEYWORD_MAX_LENGTH:
+                                type_ = keywords.get(text)
+                            if type_ is None:
+                                type_ = identifier
+                        else:
+                            type_ = OPERATORS[text]
+
+                        # Intern the lexeme, so every occurrence of a name,
+                        # keyword or operator shares one string object. Scope
+                        # and environment dicts are keyed by lexeme, and equal
+                        # keys that are the same object compare by identity.
+                        token = Token(type_, sys.intern(text), None, line)
+                        shared_tokens[text] = token
+                    tokens.append(token)
+                elif kind == "number":
+                    value: float | str | None = literals.get(text)
+                    if value is None:
+                        value = literals[text] = float(text)
+                    tokens.append(Token(number, text, value, line))
+                elif kind == "string":
+                    newlines: int = text.count("\n")
+                    if newlines:
+                        line += newlines
+                        shared_tokens.clear()
+                    value = literals.get(text)
+                    if value is None:
+                        value = literals[text] = text[1:-1]
+                    tokens.append(Token(string, text, value, line))
                 else:
-                    self._error_callback("Unexpected character.", self._line)
-
-    def __add_token(self, type_: TokenType, literal: Any = None) -> None:
-        """
-        Add a token to self._tokens.
-        """
-        # NOTE: self._current will be incremented to the right index because of
-        # self.advance().
-        text: str = self._source[self._start : self._current]
-        self._tokens += [
-            Token(type=type_, lexeme=text, literal=literal, line=self._line)
-        ]
-
-    def __advance(self) -> str:
-        """
-        Advance current.
-        Return current scanned character in source.
-        """
-        self._current += 1
-        return self._source[self._current - 1]
-
-    def __match(self, expected: str) -> bool:
-        """
-        Check if expected matches the current character being scanned.
-        Advance current if True.
-        """
-        if self.__is_at_end():
-            return False
-
-        if self._source[self._current] != expected:
-            return False
-
-        self._current += 1
-        return True
-
-    def __peek(self) -> str:
-        """
-        Look ahead by one character in source.
-        """
-        if self.__is_at_end():
-            return "\0"
-
-        return self._source[self._current]
-
-    def __peek_next(self) -> str:
-        """
-        Look ahead by two characters in source.
-        """
-        if self._current + 1 >= len(self._source):
-            return "\0"
-
-        return self._source[self._current + 1]
+                    self._start = match.start()
+                    self._current = match.end()
+                    self._line = line
+                    token_rules.get(text, unexpected_character)(self)
+                    if self._line != line:
+                        line = self._line
+                        shared_tokens.clear()
+                    if self._current != match.end():
+                        position = self._current
+                        break
+            else:
+                position = end
 
-    # Iter 1 (own version).
-    # Less explicit about advancing to consume second quote.
-    # def __string(self):
-    #     while not self.__match('"') and not self.__is_at_end():
-    #         if self.__peek() == "\n":
-    #             self._line += 1
-    #         self.__advance()
-    #
-    #     if self.__is_at_end():
-    #         self._error_callback(message="Unterminated string.", line=self._line)
-    #         return
-    #
-    #     self.__add_token(
-    #         TokenType.STRING, self._source[self._start + 1 : self._current - 1]
-    #     )
+        self._current = end
+        self._line = line
+        tokens.append(Token(TokenType.EOF, "", None, line))
+        return tokens
 
-    def __string(self) -> None:
+    def __block_comment(self) -> None:
         """
-        Produce a string token.
+        Skip a block comment. Its opening / has already been consumed.
         """
-        # Use of self.__is_at_end() needed to avoid IndexError.
-        while self.__peek() != '"' and not self.__is_at_end():
-            if self.__peek() == "\n":
-                self._line += 1
-            self.__advance()
-
-        if self.__is_at_end():
-            self._error_callback("Unterminated string.", self._line)
-            return
-
-        # Consume the closing ".
-        self.__advance()
-
-        # Trim the surrounding quotes.
-        string: str = self._source[self._start + 1 : self._current - 1]
-        self.__add_token(TokenType.STRING, string)
+        self._current += 1  # Consume the *.
+        self.__block_comments()
 
-    def __number(self) -> None:
+    def __unexpected_character(self) -> None:
         """
-        Produce a number token.
+        Report a character that can't start any token.
         """
-        while self.__is_digit(self.__peek()):
-            self.__advance()
-
-        if self.__peek() == "." and self.__is_digit(self.__peek_next()):
-            self.__advance()
-
-            while self.__is_digit(self.__peek()):
-                self.__advance()
-
-        self.__add_token(
-            TokenType.NUMBER, float(self._source[self._start : self._current])
-        )
+        self._error_callback("Unexpected character.", self._line)
 
-    def __identifier(self) -> None:
+    def __unterminated_string(self) -> None:
         """
-        Produce an identifier token.
-
-        NOTE: An identifier can be:
-        - An identifier proper
-        - A reserved keyword
+        Report a string with no closing quote, which runs to the end of the
+        source.
         """
-        while self.__is_alpha_numeric(self.__peek()):
-            self.__advance()
-
-        identifier = self._source[self._start : self._current]
-        keyword = self._keywords.get(identifier)
-
-        if keyword:
-            self.__add_token(keyword)
-        else:
-            self.__add_token(TokenType.IDENTIFIER)
-
-    # Iter 1:
-    # def __block_comment(self) -> None:
-    #     while (
-    #         not self.__is_two_chars_before_end() and not self.__is_block_comment_close()
-    #     ):
-    #         self.__advance()
-    #
-    #     if not self.__is_two_chars_before_end() and self.__is_block_comment_close():
-    #         self.__advance()
-    #         self.__advance()
-    #         return
-    #     else:
-    #         self._error_callback(message="Unterminated block comment.", line=self._line)
-    #         print(
-    #             "Unterminated block comment: " + self._source[self._start : self._current]
-    #         )
-    #
-    # def __is_two_chars_before_end(self) -> bool:
-    #     return self._current + 1 == len(self._source)
-    #
-    # def __is_block_comment_close(self) -> bool:
-    #     return self.__peek() + self.__peek_next() == "*/"
+        self._line += self._source.count("\n", self._current)
+        self._current = self._end
+        self._error_callback("Unterminated string.", self._line)
 
-    # Iter 2:
     def __block_comments(self) -> None:
         """
         Check for block comments.
         """
         # Track open block comments.
         open_block_comments: int = 1
-
-        # Loop until:
-        # - No more open block comments
-        # - Fewer than two characters to scan
-        while open_block_comments > 0 and self._current + 1 < len(self._source):
-            two_chars_ahead = self.__peek() + self.__peek_next()
-
-            # Check for new depth.
-            if two_chars_ahead == "/*":
-                self.__advance()  # Consume /.
-                self.__advance()  # Consume *.
+        source: str = self._source
+
+        # An unterminated comment runs until fewer than two characters are
+        # left to scan, leaving the last character for scan_tokens.
+        stop: int = self._end - 1
+
+        # Jump straight to the next /* or */ rather than advancing a character
+        # at a time. Whichever comes first is the one a left-to-right scan
+        # would have met. The position and line are kept in locals, and each
+        # search result is reused until the scan has moved past it, so every
+        # step searches again only for the delimiter it consumed.
+        current: int = self._current
+        line: int = self._line
+        opening: int = source.find("/*", current)
+        closing: int = source.find("*/", current)
+        while open_block_comments > 0 and (opening >= 0 or closing >= 0):
+            if opening < 0 or 0 <= closing < opening:
+                open_block_comments -= 1
+                found: int = closing
+            else:
                 open_block_comments += 1
+                found = opening
 
-            # Check for closing */.
-            elif two_chars_ahead == "*/":
-                self.__advance()  # Consume *.
-                self.__advance()  # Consume /.
-                open_block_comments -= 1
+            line += source.count("\n", current, found)
+            current = found + 2  # Consume both characters.
 
-            # Advance by one character only if no /* or */ registered.
-            else:
-                # NOTE: Use of self.__peek() is more defensive than self._source[self._current].
-                if self.__peek() == "\n":
-                    self._line += 1  # Track line number.
+            # In "/*/" the two delimiters overlap, so both may now be behind.
+            if 0 <= opening < current:
+                opening = source.find("/*", current)
+            if 0 <= closing < current:
+                closing = source.find("*/", current)
 
-                self.__advance()
+        if open_block_comments != 0 and current < stop:
+            line += source.count("\n", current, stop)
+            current = stop
 
-        # For inspection purposes.
-        # print(f"Open block comments remaining: {open_block_comments}")
-        # print("Block comment:")
-        # print(self._source[self._start : self._current] + "\n")
+        self._current = current
+        self._line = line
 
         if open_block_comments != 0:
             self._error_callback("Unterminated block comment.", self._line)
 
-    def __is_at_end(self) -> bool:
-        """
-        Check if current points to the end of source. Useful for preventing
-        IndexError.
-        """
-        return self._current >= len(self._source)
-
-    def __is_alpha_numeric(self, char: str) -> bool:
-        """
-        Check if char is alphanumeric.
-        """
-        return self.__is_alpha(char) or self.__is_digit(char)
-
-    def __is_alpha(self, char: str) -> bool:
-        """
-        Check if char is alphabetical or an underscore.
-        """
-        import string
-
-        return char in string.ascii_letters + "_"
-
-    def __is_digit(self, char: str) -> bool:
-        """Check if char is a digit."""
-        # Iter 1:
-        # return char in map(str, range(0, 10))
-
-        # Iter 2:
-        # Slightly faster than map/range.
-        return "0" <= char <= "9"
+    # Rules for the characters that start something the single pattern can't
+    # take in one step, keyed by that character: a / there always opens a
+    # block comment, and a " always opens an unterminated string. Each rule
+    # is invoked after the character has been consumed. Built at the end of
+    # the class body so the private methods are already defined.
+    _token_rules: ClassVar[MappingProxyType[str, Callable[[Scanner], None]]] = (
+        MappingProxyType({"/": __block_comment, '"': __unterminated_string})
+    )
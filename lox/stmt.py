@@ -1,4 +1,4 @@
-# Generated from GenerateAst class (2026-02-23 20:24:54.155388).
+# Generated from GenerateAst class. Do not edit by hand.
 
 from __future__ import annotations
 
@@ -12,6 +12,8 @@ R = TypeVar("R")
 
 
 class Visitor(ABC, Generic[R]):
+    __slots__ = ()
+
     @abstractmethod
     def visit_var_stmt(self, var_: Var) -> R:
         pass
@@ -54,12 +56,16 @@ class Visitor(ABC, Generic[R]):
 
 
 class Stmt(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: Visitor[R]) -> R:
         pass
 
 
 class Var(Stmt):
+    __slots__ = ("initializer", "is_initialized", "name")
+
     def __init__(self, name: Token, is_initialized: bool, initializer: Expr | None = None) -> None:
         self.name = name
         self.is_initialized = is_initialized
@@ -70,6 +76,8 @@ class Var(Stmt):
 
 
 class Expression(Stmt):
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Expr) -> None:
         self.expression = expression
 
@@ -78,6 +86,8 @@ class Expression(Stmt):
 
 
 class Function(Stmt):
+    __slots__ = ("body", "is_getter", "is_static", "name", "params")
+
     def __init__(self, name: Token, params: list[Token], body: list[Stmt], is_static: bool = False, is_getter: bool = False) -> None:
         self.name = name
         self.params = params
@@ -90,6 +100,8 @@ class Function(Stmt):
 
 
 class Class(Stmt):
+    __slots__ = ("methods", "name", "superclass")
+
     def __init__(self, name: Token, methods: list[Function], superclass: Expr.Variable | None = None) -> None:
         self.name = name
         self.methods = methods
@@ -100,6 +112,8 @@ class Class(Stmt):
 
 
 class If(Stmt):
+    __slots__ = ("condition", "else_branch", "then_branch")
+
     def __init__(self, condition: Expr, then_branch: Stmt, else_branch: Stmt | None = None) -> None:
         self.condition = condition
         self.then_branch = then_branch
@@ -110,6 +124,8 @@ class If(Stmt):
 
 
 class While(Stmt):
+    __slots__ = ("body", "condition")
+
     def __init__(self, condition: Expr, body: Stmt) -> None:
         self.condition = condition
         self.body = body
@@ -119,6 +135,8 @@ class While(Stmt):
 
 
 class Break(Stmt):
+    __slots__ = ("token",)
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
@@ -127,6 +145,8 @@ class Break(Stmt):
 
 
 class Print(Stmt):
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Expr) -> None:
         self.expression = expression
 
@@ -135,6 +155,8 @@ class Print(Stmt):
 
 
 class Return(Stmt):
+    __slots__ = ("keyword", "value")
+
     def __init__(self, keyword: Token, value: Expr | None = None) -> None:
         self.keyword = keyword
         self.value = value
@@ -144,6 +166,8 @@ class Return(Stmt):
 
 
 class Block(Stmt):
+    __slots__ = ("statements",)
+
     def __init__(self, statements: list[Stmt]) -> None:
         self.statements = statements
 
@@ -4,7 +4,13 @@ from typing import Any
 from .token_type import TokenType
 
 
-@dataclass(frozen=True)
+# One Token is created for every lexeme in the source, so fields live in slots
+# rather than a per-instance __dict__. Not frozen: a frozen __init__ sets each
+# field through object.__setattr__, which makes construction about three times
+# slower. Nothing modifies a Token after scanning, which the scanner relies on
+# when it shares one Token between repeats on a line. Tokens compare and hash
+# by identity, since no caller compares them by value.
+@dataclass(slots=True, eq=False)
 class Token:
     type: TokenType
     lexeme: str
@@ -14,7 +20,7 @@ class Token:
     def __str__(self) -> str:
         return (
             f"Type: {self.type.name} "
-            + f"Lexeme: {self.lexeme} "
-            + f"Literal: {self.literal if self.literal else 'None'} "
-            + f"Line: {self.line}"
+            f"Lexeme: {self.lexeme} "
+            f"Literal: {self.literal if self.literal else 'None'} "
+            f"Line: {self.line}"
         )
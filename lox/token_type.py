@@ -1,7 +1,11 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class TokenType(Enum):
+# An IntEnum rather than an Enum: members then hash and compare as the ints
+# they are, in C, whereas Enum.__hash__ is a Python-level method. Scanner and
+# Parser tables and frozensets are keyed by TokenType, so every lookup in them
+# pays for a hash.
+class TokenType(IntEnum):
     # Single-character tokens.
     LEFT_PAREN = auto()
     RIGHT_PAREN = auto()
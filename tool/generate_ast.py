@@ -1,18 +1,64 @@
 from __future__ import annotations
 
+import re
 import sys
-from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import datetime
-from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 
 from lox.token_type import TokenType
 
 TAB = "    "
-
-
-@dataclass()
+# Fixed lines of the abstract visit and accept methods, formatted once rather
+# than for every node type.
+ABSTRACT_METHOD: Final = f"{TAB}@abstractmethod"
+PASS_BODY: Final = f"{TAB}{TAB}pass"
+ACCEPT_SIGNATURE: Final = f"{TAB}def accept(self, visitor: Visitor[R]) -> R:"
+# Import block of each generated module. There are only the two, so they are
+# spelled out once here rather than assembled on every call.
+IMPORTS: Final = MappingProxyType(
+    {
+        "Expr": (
+            "from __future__ import annotations",
+            "",
+            "from abc import ABC, abstractmethod",
+            "from typing import TYPE_CHECKING, Generic, TypeVar",
+            "",
+            "from lox.token import Token",
+            "",
+            # Stmt only appears in annotations (Lambda's body), so import it
+            # for type checkers alone rather than pulling in lox.stmt when
+            # lox.expr is first imported.
+            "if TYPE_CHECKING:",
+            f"{TAB}from lox.stmt import Stmt",
+            "",
+        ),
+        "Stmt": (
+            "from __future__ import annotations",
+            "",
+            "from abc import ABC, abstractmethod",
+            "from typing import Generic, TypeVar",
+            "",
+            "from lox.expr import Expr",
+            "from lox.token import Token",
+            "",
+        ),
+    }
+)
+# A type spec is "Name : attribute type, attribute type = default, ...". Each
+# pattern takes a spec, or one comma-separated attribute of it, in a single
+# match and strips the surrounding whitespace as it goes. An attribute's type
+# is everything after its name, including any default.
+TYPE_SPEC_PATTERN: Final = re.compile(r"\s*([^:]*?)\s*:(.*)", re.DOTALL)
+ATTRIBUTE_PATTERN: Final = re.compile(r"\s*(\S+)\s+(.*?)\s*", re.DOTALL)
+# Lowercased TokenType member names. A visit method's parameter is named after
+# its node in lowercase, and gets a trailing underscore when that would shadow
+# a token type name (e.g. print_, return_).
+TOKEN_TYPE_NAMES: Final = frozenset(name.lower() for name in TokenType._member_names_)
+
+
+@dataclass(frozen=True, slots=True)
 class TypeDefinition:
     """Type definition of subclasses."""
 
@@ -30,6 +76,12 @@ class GenerateAst:
             sys.exit(64)
 
         output_dir: Path = Path(args[0])
+        # Both modules go to the same directory, so make sure it exists once
+        # here rather than in every __define_ast call.
+        output_dir.mkdir(
+            parents=True,  # Create any missing parent dirs.
+            exist_ok=True,  # Don't error if dir exists.
+        )
         GenerateAst.__define_ast(
             output_dir,
             "Stmt",
@@ -50,7 +102,7 @@ class GenerateAst:
             output_dir,
             "Expr",
             [
-                "Assign      : name Token, value Expr",
+                "Assign      : name Token, value Expr, depth int | None = None",
                 "Logical     : left Expr, operator Token, right Expr",
                 "Ternary     : condition Expr, consequent Expr, alternative Expr",
                 "Binary      : left Expr, operator Token, right Expr",
@@ -58,75 +110,73 @@ class GenerateAst:
                 "Grouping    : expression Expr",
                 "Literal     : value object",
                 "Unary       : operator Token, right Expr",
-                "Variable    : name Token",
+                "Variable    : name Token, depth int | None = None",
                 "Lambda      : params list[Token], body list[Stmt]",
                 "Get         : object Expr, name Token",
                 "Set         : object Expr, name Token, value Expr",
-                "This        : keyword Token",
-                "Super       : keyword Token, method Token",
+                "This        : keyword Token, depth int | None = None",
+                "Super       : keyword Token, method Token, depth int | None = None",
             ],
         )
 
     @staticmethod
     def __define_ast(output_dir: Path, base_name: str, types: list[str]) -> None:
-        """Generate AST classes from type definitions."""
-        output_dir.mkdir(
-            parents=True,  # Create any missing parent dirs.
-            exist_ok=True,  # Don't error if dir exists.
-        )
+        """Generate AST classes from type definitions. output_dir must already
+        exist."""
         path: Path = output_dir / f"{base_name.lower()}.py"
         type_definitions: list[TypeDefinition] = (
             GenerateAst.__generate_type_definitions(types)
         )
-        body: Iterator[str] = [
-            line + "\n"
-            for line in [
-                *GenerateAst.__generate_documentation(),
-                *GenerateAst.__generate_imports(base_name),
-                *GenerateAst.__generate_visitor(base_name, type_definitions),
-                *GenerateAst.__generate_base_class(base_name),
-                *GenerateAst.__generate_child_classes(base_name, type_definitions),
-            ]
+        lines: list[str] = [
+            *GenerateAst.__generate_documentation(),
+            *GenerateAst.__generate_imports(base_name),
+            *GenerateAst.__generate_visitor(base_name, type_definitions),
+            *GenerateAst.__generate_base_class(base_name),
+            *GenerateAst.__generate_child_classes(base_name, type_definitions),
         ]
 
-        with open(path, "w", encoding="utf-8") as writer:
-            writer.writelines(body)
+        # Join once and write once, rather than appending a newline to each
+        # line and writing the lines one by one. A single write larger than the
+        # buffer goes straight through, so the default buffer size is fine.
+        source: str = "\n".join(lines) + "\n"
+
+        # Leave a module that is already up to date untouched, so that its
+        # mtime only changes when the AST does.
+        if path.is_file() and path.read_bytes() == source.encode("utf-8"):
+            return
+
+        # newline="\n" writes the newlines as they are instead of translating
+        # them to the platform's line ending.
+        with open(path, "w", encoding="utf-8", newline="\n") as writer:
+            writer.write(source)
 
     @staticmethod
     def __generate_type_definitions(types: list[str]) -> list[TypeDefinition]:
         """Generate type definitions."""
         type_definitions: list[TypeDefinition] = []
         for type_spec in types:
-            if ":" not in type_spec:
+            spec_match: re.Match[str] | None = TYPE_SPEC_PATTERN.fullmatch(type_spec)
+            if spec_match is None:
                 print(f"Failed to generate type definition. Missing colon: {type_spec}")
                 sys.exit(64)
 
-            name_part, attrs_part = type_spec.split(":", 1)
-            name: str = name_part.strip()
+            name, attrs_part = spec_match.groups()
 
             attributes: list[tuple[str, str]] = []
             if not attrs_part.strip():
                 pass
             else:
-                attr_strings: list[str] = [
-                    attr.strip() for attr in attrs_part.split(",")
-                ]
-                for attr_str in attr_strings:
-                    attr_parts: list[str] = attr_str.split()
-
-                    if len(attr_parts) > 2:
-                        attr_parts = [
-                            attr_parts[0],
-                            " ".join(attr_parts[1:]),
-                        ]
-
-                    if len(attr_parts) != 2:
+                for attr_str in attrs_part.split(","):
+                    attr_match: re.Match[str] | None = ATTRIBUTE_PATTERN.fullmatch(
+                        attr_str
+                    )
+                    if attr_match is None:
                         print(
-                            f"Unable to generate type definition. Incomplete attribute: {attr_str}"
+                            f"Unable to generate type definition. Incomplete attribute: {attr_str.strip()}"
                         )
                         sys.exit(64)
 
-                    attr_name, attr_types = attr_parts
+                    attr_name, attr_types = attr_match.groups()
                     attributes.append((attr_name, attr_types))
 
             type_definitions.append(TypeDefinition(name=name, attributes=attributes))
@@ -136,31 +186,17 @@ class GenerateAst:
     @staticmethod
     def __generate_documentation() -> list[str]:
         """Generate documentation."""
+        # No timestamp: regenerating from unchanged specs should produce the
+        # same bytes, so the output only changes when the AST does.
         return [
-            f"# Generated from GenerateAst class ({datetime.now()}).",
+            "# Generated from GenerateAst class. Do not edit by hand.",
             "",
         ]
 
     @staticmethod
     def __generate_imports(base_name: str) -> list[str]:
         """Generate imports."""
-        imports: list[str] = [
-            "from __future__ import annotations",
-            "",
-            "from abc import ABC, abstractmethod",
-            # "from dataclasses import dataclass",
-            "from typing import Generic, TypeVar",
-            "",
-        ]
-
-        match base_name:
-            case "Expr":
-                imports.extend(["from lox.token import Token", ""])
-            case "Stmt":
-                imports.extend(["from lox.expr import Expr"])
-                imports.extend(["from lox.token import Token", ""])
-
-        return imports
+        return list(IMPORTS[base_name])
 
     @staticmethod
     def __generate_visitor(
@@ -169,51 +205,35 @@ class GenerateAst:
         """Generate Visitor interface."""
         generic: list[str] = ['R = TypeVar("R")', "", ""]
         signature: list[str] = ["class Visitor(ABC, Generic[R]):"]
-        abstract_visit_methods: list[str] = list(
-            chain.from_iterable(
-                [
-                    f"{TAB}@abstractmethod",
-                    GenerateAst.__generate_abstract_visit_method_signature(
-                        base_name, type_definition
-                    ),
-                    f"{TAB}{TAB}pass",
-                    "",
-                ]
-                for type_definition in type_definitions
+        # Empty slots so that visitors declaring their own __slots__, such as
+        # the resolver, don't get a per-instance __dict__ anyway.
+        slots: list[str] = [f"{TAB}__slots__ = ()", ""]
+        abstract_visit_methods: list[str] = []
+        for type_definition in type_definitions:
+            abstract_visit_methods.append(ABSTRACT_METHOD)
+            abstract_visit_methods.append(
+                GenerateAst.__generate_abstract_visit_method_signature(
+                    base_name, type_definition
+                )
             )
-        )
+            abstract_visit_methods.append(PASS_BODY)
+            abstract_visit_methods.append("")
         spacing: list[str] = [""]
 
-        # Iter 1 of abstract_visit_methods with nested loop:
-        # abstract_visit_methods = [
-        #     line
-        #     for abstract_visit_method in [
-        #         [
-        #             f"{TAB}@abstractmethod",
-        #             f"{TAB}def visit_{type_definition.name.lower()}_{base_name.lower()}(self, {type_definition.name.lower()}: {type_definition.name}) -> R:",
-        #             f"{TAB}{TAB}pass",
-        #             "",
-        #         ]
-        #         for type_definition in type_definitions
-        #     ]
-        #     for line in abstract_visit_method
-        # ]
-
-        return generic + signature + abstract_visit_methods + spacing
+        return generic + signature + slots + abstract_visit_methods + spacing
 
     @staticmethod
     def __generate_abstract_visit_method_signature(
         base_name: str, type_definition: TypeDefinition
     ) -> str:
-        method_name: str = f"visit_{type_definition.name.lower()}_{base_name.lower()}"
+        name: str = type_definition.name.lower()
+        method_name: str = f"visit_{name}_{base_name.lower()}"
         params: str = "self, "
 
-        if type_definition.name.lower() not in [
-            name.lower() for name in TokenType._member_names_
-        ]:
-            params += type_definition.name.lower()
+        if name not in TOKEN_TYPE_NAMES:
+            params += name
         else:
-            params += type_definition.name.lower() + "_"
+            params += name + "_"
 
         return f"{TAB}def {method_name}({params}: {type_definition.name}) -> R:"
 
@@ -221,72 +241,70 @@ class GenerateAst:
     def __generate_base_class(base_name: str) -> list[str]:
         """Generate base class."""
         signature: list[str] = [
-            # "@dataclass(frozen=True)",
             f"class {base_name}(ABC):",
         ]
+        # Empty slots on the base so that subclasses declaring their own
+        # __slots__ don't get a per-instance __dict__ anyway.
+        slots: list[str] = [f"{TAB}__slots__ = ()", ""]
         abstract_accept_method: list[str] = [
-            f"{TAB}@abstractmethod",
-            f"{TAB}def accept(self, visitor: Visitor[R]) -> R:",
-            f"{TAB}{TAB}pass",
+            ABSTRACT_METHOD,
+            ACCEPT_SIGNATURE,
+            PASS_BODY,
         ]
         spacing: list[str] = [
             "",
             "",
         ]
 
-        return signature + abstract_accept_method + spacing
+        return signature + slots + abstract_accept_method + spacing
 
     @staticmethod
     def __generate_child_classes(
         base_name: str, type_definitions: list[TypeDefinition]
     ) -> list[str]:
         """Generate child classes based on type definitions."""
+        # Every class is appended straight onto one list, rather than each
+        # built as a concatenation of signature, __init__ and accept lists.
         child_classes: list[str] = []
         for index, type_definition in enumerate(type_definitions):
-            child_classes.extend(
-                GenerateAst.__generate_child_class(base_name, type_definition)
-            )
-
-            if index != len(type_definitions) - 1:
+            if index:
                 child_classes.extend(["", ""])
 
-        return child_classes
-
-    @staticmethod
-    def __generate_child_class(
-        base_name: str, type_definition: TypeDefinition
-    ) -> list[str]:
-        """Generate single child class based on type definition."""
-        signature: list[str] = [
-            # "@dataclass(frozen=True)",
-            f"class {type_definition.name}({base_name}):",
-        ]
-
-        if type_definition.name.lower() == "lambda":
-            signature.extend([f"{TAB}from lox.stmt import Stmt", ""])
+            child_classes.append(f"class {type_definition.name}({base_name}):")
 
-        attribute_params: str = ", ".join(
-            [
-                f"{attr_name}: {attr_types}"
-                for attr_name, attr_types in type_definition.attributes
+            # Nodes are allocated by the thousand while parsing, so store their
+            # attributes in slots rather than a per-instance __dict__. Sorted,
+            # since the order of __slots__ carries no meaning.
+            slot_names: list[str] = [
+                f'"{attr_name}"'
+                for attr_name in sorted(
+                    attr_name for attr_name, _ in type_definition.attributes
+                )
             ]
-        )
-        attribute_initializers: list[str] = [
-            f"{TAB}{TAB}self.{attr_name} = {attr_name}"
-            for attr_name, _ in type_definition.attributes
-        ]
-        init_method: list[str] = [
-            f"{TAB}def __init__(self, {attribute_params}) -> None:",
-            *attribute_initializers,
-            "",
-        ]
+            slots: str = ", ".join(slot_names) + ("," if len(slot_names) == 1 else "")
+            child_classes.extend([f"{TAB}__slots__ = ({slots})", ""])
 
-        accept_method: list[str] = [
-            f"{TAB}def accept(self, visitor: Visitor[R]) -> R:",
-            f"{TAB}{TAB}return visitor.visit_{type_definition.name.lower()}_{base_name.lower()}(self)",
-        ]
+            attribute_params: str = ", ".join(
+                [
+                    f"{attr_name}: {attr_types}"
+                    for attr_name, attr_types in type_definition.attributes
+                ]
+            )
+            child_classes.append(
+                f"{TAB}def __init__(self, {attribute_params}) -> None:"
+            )
+            child_classes.extend(
+                f"{TAB}{TAB}self.{attr_name} = {attr_name}"
+                for attr_name, _ in type_definition.attributes
+            )
+            child_classes.append("")
+
+            child_classes.append(ACCEPT_SIGNATURE)
+            child_classes.append(
+                f"{TAB}{TAB}return visitor.visit_{type_definition.name.lower()}_{base_name.lower()}(self)"
+            )
 
-        return signature + init_method + accept_method
+        return child_classes
 
 
 if __name__ == "__main__":